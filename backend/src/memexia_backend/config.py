@@ -1,5 +1,9 @@
-from typing import Literal
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Literal, Optional
+from urllib.parse import urlsplit
+
+from pydantic import model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -8,6 +12,8 @@ class Settings(BaseSettings):
     # Graph Database Backend Selection
     # Options: "kuzu" (embedded, default) or "nebula" (distributed)
     GRAPH_DB_TYPE: Literal["kuzu", "nebula"] = "kuzu"
+    # Knowledge bases (most recently updated first) whose graph sessions are opened at startup
+    GRAPH_WARM_KB_COUNT: int = 5
 
     # Kuzu Settings (embedded graph database)
     KUZU_DB_PATH: str = "./data/kuzu_db"
@@ -18,20 +24,39 @@ class Settings(BaseSettings):
     NEBULA_PORT: int = 9669
     NEBULA_USER: str = "root"
     NEBULA_PASSWORD: str = "nebula"
+    # Optional "nebula://host:port" shorthand; overrides NEBULA_HOST/NEBULA_PORT
+    NEBULA_URI: Optional[str] = None
 
     # ChromaDB Settings
     CHROMA_DB_PATH: str = "./data/chroma_db"
 
     # Model Settings
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    # "torch", or "onnx" to run an ONNX export with ONNX Runtime
+    # (needs the `onnx` extra; falls back to torch if it can't load)
+    EMBEDDING_BACKEND: Literal["torch", "onnx"] = "torch"
+    EMBEDDING_ONNX_FILE: str = "onnx/model.onnx"
 
     # SQL Database Settings
     SQLALCHEMY_DATABASE_URL: str = "sqlite:///./data/memexia.db"
 
+    # SQL Connection Pool Settings
+    # Recycle and connect timeout only apply to server databases, not SQLite
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_CONNECT_TIMEOUT: int = 10
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Worker threads for sync route handlers; defaults to enough for every
+    # pooled SQL connection (pool size + overflow), and never below AnyIO's 40
+    THREADPOOL_SIZE: Optional[int] = None
+
     # Security
     SECRET_KEY: str = "your-secret-key-keep-it-secret"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    BCRYPT_ROUNDS: int = 12
 
     # Email Settings
     ENABLE_EMAIL_VERIFICATION: bool = False
@@ -58,10 +83,45 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-4o-mini"
     OPENAI_MAX_TOKENS: int = 2048
     OPENAI_TEMPERATURE: float = 0.7
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-
-
-settings = Settings()  # type: ignore
+    # Connections kept open to the API, shared by all requests
+    OPENAI_POOL_KEEPALIVE: int = 100
+    OPENAI_POOL_MAX: int = 200
+    # Multiplex streams over HTTP/2 (needs the h2 package: httpx[http2])
+    OPENAI_HTTP2: bool = False
+    # Constrain expansions to the concepts JSON schema (structured outputs);
+    # off by default since not every compatible API accepts response_format
+    OPENAI_STRUCTURED_OUTPUT: bool = False
+
+    # AI expansion cache: near-duplicate expansions replay a stored result
+    # instead of calling the model (0 disables)
+    AI_CACHE_TTL_SECONDS: int = 0
+    AI_CACHE_MIN_SIMILARITY: float = 0.92
+
+    @model_validator(mode="after")
+    def _apply_nebula_uri(self) -> "Settings":
+        """Split NEBULA_URI into host and port once, at load time."""
+        if self.NEBULA_URI:
+            uri = self.NEBULA_URI
+            if "://" not in uri:
+                uri = f"nebula://{uri}"
+            parts = urlsplit(uri)
+            if parts.hostname:
+                self.NEBULA_HOST = parts.hostname
+            if parts.port:
+                self.NEBULA_PORT = parts.port
+        return self
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, reading `.env` only once."""
+    return Settings()  # type: ignore
+
+
+settings = get_settings()
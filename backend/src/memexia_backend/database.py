@@ -5,42 +5,156 @@ Provides ChromaDB and SQLAlchemy connections.
 Graph database is handled by the services.graph module.
 """
 
-import chromadb
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
 from memexia_backend.config import settings
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import DeclarativeBase, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from memexia_backend.logger import logger
 
 
-# ChromaDB Client
-chroma_client = chromadb.PersistentClient(path=settings.CHROMA_DB_PATH)
+# ChromaDB is imported lazily so that importing models (via Base) stays cheap
+_chroma_client = None
+_chroma_collection = None
+_ai_cache_collection = None
+_chroma_lock = threading.Lock()
+
+
+def get_chroma_client():
+    """Get the ChromaDB client, creating it on first use."""
+    global _chroma_client
+
+    if _chroma_client is None:
+        with _chroma_lock:
+            if _chroma_client is None:
+                import chromadb
+
+                _chroma_client = chromadb.PersistentClient(path=settings.CHROMA_DB_PATH)
+    return _chroma_client
 
 
 def get_chroma_collection():
-    """Get or create the ChromaDB collection for nodes."""
-    return chroma_client.get_or_create_collection(name="memexia_nodes")
+    """Get or create the ChromaDB collection for nodes (resolved once)."""
+    global _chroma_collection
+
+    if _chroma_collection is None:
+        client = get_chroma_client()
+        with _chroma_lock:
+            if _chroma_collection is None:
+                _chroma_collection = client.get_or_create_collection(
+                    name="memexia_nodes"
+                )
+    return _chroma_collection
+
+
+def get_ai_cache_collection():
+    """Get or create the ChromaDB collection caching AI expansions."""
+    global _ai_cache_collection
+
+    if _ai_cache_collection is None:
+        client = get_chroma_client()
+        with _chroma_lock:
+            if _ai_cache_collection is None:
+                _ai_cache_collection = client.get_or_create_collection(
+                    name="ai_expansion_cache",
+                    metadata={"hnsw:space": "cosine"},
+                )
+    return _ai_cache_collection
+
+
+def _create_sql_engine():
+    """Create the SQLAlchemy engine with pooling tuned for the configured backend."""
+    url = settings.SQLALCHEMY_DATABASE_URL
+
+    if url.startswith("sqlite"):
+        # An in-memory database must share a single connection or each
+        # checkout would see an empty DB. File databases keep a small pool so
+        # the per-connection PRAGMAs below run once per connection.
+        is_memory = url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+        if is_memory:
+            return create_engine(
+                url,
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool,
+                query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+            )
+        return create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        )
+
+    return create_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT},
+    )
 
 
 # SQLAlchemy setup
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-    if "sqlite" in settings.SQLALCHEMY_DATABASE_URL
-    else {},
-)
+engine = _create_sql_engine()
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """Use WAL so readers don't block writers, and keep hot pages in memory."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-20000")
+        cursor.close()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+# Identifier of the HTTP request being served, set by middleware in main.py
+request_scope_id: ContextVar[Optional[str]] = ContextVar("request_scope_id", default=None)
+
+
+def _get_request_scope():
+    """Scope sessions per request, falling back to the thread outside requests."""
+    return request_scope_id.get() or threading.get_ident()
+
+
+RequestSession = scoped_session(SessionLocal, scopefunc=_get_request_scope)
+
+
+class Base(DeclarativeBase):
+    """Declarative base class for all ORM models."""
+
+    pass
+
+
+@contextmanager
+def session_scope():
+    """Provide a scoped session outside of request handling (startup, tasks)."""
+    db = RequestSession()
+    try:
+        yield db
+    finally:
+        RequestSession.remove()
 
 
 def get_db():
-    """Get SQLAlchemy database session."""
-    db = SessionLocal()
+    """Get the SQLAlchemy session bound to the current request."""
+    db = RequestSession()
     try:
         yield db
     finally:
-        db.close()
+        RequestSession.remove()
 
 
 def close_connections():
@@ -48,4 +162,6 @@ def close_connections():
     from memexia_backend.services.graph import close_graph_db
 
     close_graph_db()
+    RequestSession.remove()
+    engine.dispose()
     logger.info("All database connections closed")
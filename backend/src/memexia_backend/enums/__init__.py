@@ -1,4 +1,11 @@
-from .permissions import Permission
-from .roles import UserRole, ROLE_PERMISSIONS
+from .permissions import Permission, PERMISSION_BITS
+from .roles import UserRole, ROLE_PERMISSIONS, ROLE_MASKS, role_has_permission
 
-__all__ = ["Permission", "UserRole", "ROLE_PERMISSIONS"]
+__all__ = [
+    "Permission",
+    "PERMISSION_BITS",
+    "UserRole",
+    "ROLE_PERMISSIONS",
+    "ROLE_MASKS",
+    "role_has_permission",
+]
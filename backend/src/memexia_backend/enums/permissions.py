@@ -42,3 +42,14 @@ class Permission(str, Enum):
 
     # System permissions
     SYSTEM_ADMIN = "system:admin"
+
+    @property
+    def bit(self) -> int:
+        """Single-bit mask identifying this permission."""
+        return PERMISSION_BITS[self]
+
+
+# Each permission owns one bit so role permission sets can be stored as ints
+PERMISSION_BITS: dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
@@ -6,9 +6,8 @@ The static mapping can be replaced with database queries for full RBAC support.
 """
 
 from enum import Enum
-from typing import Set
 
-from .permissions import Permission
+from .permissions import Permission, PERMISSION_BITS
 
 
 class UserRole(str, Enum):
@@ -20,8 +19,8 @@ class UserRole(str, Enum):
 
 # Role-Permission mapping
 # This static mapping can be migrated to a database table for dynamic RBAC
-ROLE_PERMISSIONS: dict[UserRole, Set[Permission]] = {
-    UserRole.ADMIN: {
+ROLE_PERMISSIONS: dict[UserRole, frozenset[Permission]] = {
+    UserRole.ADMIN: frozenset({
         # Admin has all permissions
         Permission.KB_CREATE,
         Permission.KB_READ_OWN,
@@ -40,8 +39,8 @@ ROLE_PERMISSIONS: dict[UserRole, Set[Permission]] = {
         Permission.USER_UPDATE_ROLE,
         Permission.USER_DELETE,
         Permission.SYSTEM_ADMIN,
-    },
-    UserRole.USER: {
+    }),
+    UserRole.USER: frozenset({
         # Regular user permissions
         Permission.KB_CREATE,
         Permission.KB_READ_OWN,
@@ -53,15 +52,21 @@ ROLE_PERMISSIONS: dict[UserRole, Set[Permission]] = {
         Permission.NODE_READ,
         Permission.NODE_UPDATE,
         Permission.NODE_DELETE,
-    },
+    }),
+}
+
+# Permission bitmask per role, precomputed so checks are a single AND
+ROLE_MASKS: dict[UserRole, int] = {
+    role: sum(PERMISSION_BITS[permission] for permission in permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
 }
 
 
-def get_permissions_for_role(role: UserRole) -> Set[Permission]:
+def get_permissions_for_role(role: UserRole) -> frozenset[Permission]:
     """Get all permissions for a given role."""
-    return ROLE_PERMISSIONS.get(role, set())
+    return ROLE_PERMISSIONS.get(role, frozenset())
 
 
 def role_has_permission(role: UserRole, permission: Permission) -> bool:
     """Check if a role has a specific permission."""
-    return permission in ROLE_PERMISSIONS.get(role, set())
+    return bool(ROLE_MASKS.get(role, 0) & PERMISSION_BITS[permission])
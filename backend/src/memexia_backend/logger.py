@@ -1,9 +1,14 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 from .config import Settings
 
+_LOGGING_FILE = logging.__file__
+# Upper bound on frames walked per record when locating the original caller
+_MAX_FRAME_DEPTH = 20
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -17,10 +22,14 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        # currentframe() may return None, so guard before accessing attributes
-        while frame is not None and frame.f_code.co_filename == logging.__file__:
+        # Find caller from where originated the logged message, starting
+        # just above emit() and skipping the stdlib logging frames
+        frame, depth = sys._getframe(1), 1
+        while (
+            frame is not None
+            and frame.f_code.co_filename == _LOGGING_FILE
+            and depth < _MAX_FRAME_DEPTH
+        ):
             frame = frame.f_back
             depth += 1
 
@@ -29,15 +38,20 @@ class InterceptHandler(logging.Handler):
         )
 
 
-def format_name(record):
-    """自定义格式化函数，限制文件名长度为20个字符，显示最后20个字符"""
-    name = record["name"]
+@lru_cache(maxsize=512)
+def _short_name(name: str) -> str:
+    """按模块名缓存截断结果，模块名数量有限且重复出现"""
     # 如果文件名长度超过20，只取最后20个字符
     if len(name) > 23:
         return "..." + name[-20:]
     return name
 
 
+def format_name(record):
+    """自定义格式化函数，限制文件名长度为20个字符，显示最后20个字符"""
+    return _short_name(record["name"])
+
+
 def setup_logging(settings: Settings):
     """
     Configure Loguru logger and intercept standard logging.
@@ -55,7 +69,7 @@ def setup_logging(settings: Settings):
         extra = record.get("extra")
         if extra is None:
             record["extra"] = {}
-        record["extra"]["short_name"] = format_name(record)
+        record["extra"]["short_name"] = _short_name(record["name"])
         return True
 
     # Add stdout handler
@@ -73,9 +87,10 @@ def setup_logging(settings: Settings):
     log_path.mkdir(exist_ok=True)
 
     logger.add(
-        log_path / "memexia_{time:YYYY-MM-DD}.log",
-        rotation="00:00",  # New file every day at midnight
+        log_path / "memexia_{time:YYYY-MM-DD_HH}.log",
+        rotation="100 MB",  # Rotate by size to avoid a midnight I/O spike
         retention="30 days",  # Keep logs for 30 days
+        compression="gz",  # Compress rotated files
         level="DEBUG",  # Always log DEBUG to file
         format=file_log_format,
         encoding="utf-8",
@@ -83,13 +98,11 @@ def setup_logging(settings: Settings):
         filter=_inject_short_name,
     )
 
-    # Intercept standard logging
+    # Intercept standard logging with a single root-level handler
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
 
-    # Hijack uvicorn and fastapi loggers
-    # We need to make sure we don't duplicate logs if uvicorn is already configured
-    # But since we force basicConfig with InterceptHandler, it should be fine.
-    # Explicitly setting handlers for specific loggers ensures they use ours.
+    # uvicorn installs its own handlers on these loggers; drop them so records
+    # propagate to the root intercept instead of being handled twice.
     for log_name in [
         "uvicorn",
         "uvicorn.access",
@@ -100,7 +113,7 @@ def setup_logging(settings: Settings):
         "fastapi",
     ]:
         logging_logger = logging.getLogger(log_name)
-        logging_logger.handlers = [InterceptHandler()]
-        logging_logger.propagate = False
+        logging_logger.handlers.clear()
+        logging_logger.propagate = True
 
     return logger
@@ -1,6 +1,12 @@
-from fastapi import FastAPI
+import uuid
+
+import anyio.to_thread
+
+from fastapi import FastAPI, Request, status
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 
 from memexia_backend.routers import (
     graph_router,
@@ -11,7 +17,8 @@ from memexia_backend.routers import (
     admin_router,
 )
 from memexia_backend.database import close_connections
-from memexia_backend.database import engine, Base
+from memexia_backend.database import request_scope_id
+from memexia_backend.services import ai_service
 from memexia_backend.services.init_service import init_all_services
 from memexia_backend.logger import setup_logging, logger
 from memexia_backend.config import settings
@@ -19,16 +26,20 @@ from memexia_backend.config import settings
 setup_logging(settings)
 
 
-# Create SQL database tables
-Base.metadata.create_all(bind=engine)
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown tasks."""
     # Startup
     logger.info("🚀 Starting Memexia Backend...")
 
+    # Sync handlers and dependencies run in AnyIO's threadpool; size it so
+    # every pooled SQL connection can be in use at once
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.THREADPOOL_SIZE or max(
+        limiter.total_tokens, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+    logger.debug(f"Threadpool size: {limiter.total_tokens}")
+
     # Initialize all services including Neo4j deployment
     try:
         init_all_services()
@@ -46,6 +57,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("🛑 Shutting down Memexia Backend...")
+    await ai_service.aclose()
     close_connections()
     logger.info("✅ Memexia Backend shutdown complete")
 
@@ -55,6 +67,7 @@ app = FastAPI(
     description="API for Memexia - Autonomous Thought Universe",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -66,6 +79,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def bind_request_scope(request: Request, call_next):
+    """Tag the request so all dependencies share one SQLAlchemy session."""
+    token = request_scope_id.set(uuid.uuid4().hex)
+    try:
+        return await call_next(request)
+    finally:
+        request_scope_id.reset(token)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Fail fast with 503 when no SQL connection frees up within DB_POOL_TIMEOUT."""
+    logger.warning(f"SQL connection pool exhausted on {request.url.path}: {exc}")
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service temporarily unavailable, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 app.include_router(auth_router)
 app.include_router(graph_router)
 app.include_router(nodes_router)
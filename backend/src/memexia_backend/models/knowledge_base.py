@@ -8,13 +8,16 @@ import uuid
 
 from datetime import datetime
 
-from sqlalchemy import  Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Index, Integer, String, Boolean, DateTime, ForeignKey, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship,Mapped, mapped_column
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from ..database import Base
 
+if TYPE_CHECKING:
+    from .user import User
+
 
 def generate_uuid():
     """Generate a UUID string for knowledge base ID."""
@@ -25,6 +28,10 @@ class KnowledgeBase(Base):
     """Knowledge base model - a collection of related thought nodes."""
 
     __tablename__ = "knowledge_bases"
+    __table_args__ = (
+        # Listing by owner / visibility
+        Index("ix_kb_owner_public", "owner_id", "is_public"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, default=generate_uuid
@@ -32,7 +39,7 @@ class KnowledgeBase(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     owner_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
-    seed_node_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # Neo4j node ID
+    seed_node_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # Graph node ID
     is_public: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -42,7 +49,7 @@ class KnowledgeBase(Base):
     )
 
     # Relationships
-    owner = relationship("User", back_populates="knowledge_bases")
+    owner: Mapped["User"] = relationship("User", back_populates="knowledge_bases")
 
     def __repr__(self):
         return f"<KnowledgeBase(id={self.id}, name={self.name}, owner_id={self.owner_id})>"
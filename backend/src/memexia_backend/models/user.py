@@ -1,4 +1,5 @@
-from sqlalchemy import Integer, String, Boolean, DateTime
+from sqlalchemy import Index, Integer, String, Boolean, DateTime, or_
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -18,6 +19,10 @@ class User(Base):
     """User model with role-based access control."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Email lookups that also filter on account status
+        Index("ix_users_email_active", "email", "is_active"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
@@ -32,7 +37,7 @@ class User(Base):
     )
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     role: Mapped[str] = mapped_column(
-        String, default=UserRole.USER.value, nullable=False
+        String, default=UserRole.USER.value, index=True, nullable=False
     )
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -49,11 +54,17 @@ class User(Base):
         "KnowledgeBase", back_populates="owner", cascade="all, delete-orphan"
     )
 
-    @property
+    @hybrid_property
     def is_admin(self) -> bool:
         """Check if user is admin or superuser."""
         return bool((self.role == UserRole.ADMIN.value) or self.is_superuser)
 
+    @is_admin.inplace.expression
+    @classmethod
+    def _is_admin_expression(cls):
+        """SQL form of is_admin, usable in query filters."""
+        return or_(cls.role == UserRole.ADMIN.value, cls.is_superuser.is_(True))
+
     @property
     def password(self) -> str:
         raise AttributeError("Password is write-only.")
@@ -1,23 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from memexia_backend.database import get_db
-from memexia_backend.models import User
 from memexia_backend.schemas import AuthSettings, GraphDBSettings
 from memexia_backend.services.settings_service import SettingsService
-from memexia_backend.routers.v1.auth import get_current_user
+from memexia_backend.routers.v1.auth import get_token_username, get_user
+from memexia_backend.utils.permissions import cache_admin, is_cached_admin
 
 router = APIRouter(tags=["admin"], prefix="/api/v1/admin")
 
 
-def check_admin(current_user: User = Depends(get_current_user)):
-    if not current_user.is_admin:
+def check_admin(
+    username: str = Depends(get_token_username), db: Session = Depends(get_db)
+) -> str:
+    """Require an admin, reusing a recent confirmation instead of a user lookup."""
+    if is_cached_admin(username):
+        return username
+
+    user = get_user(db, username=username)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not user.is_admin:
         raise HTTPException(status_code=403, detail="Not authorized")
-    return current_user
+
+    cache_admin(username)
+    return username
 
 
 @router.get("/settings/auth", response_model=AuthSettings)
 def get_auth_settings(
-    db: Session = Depends(get_db), current_user: User = Depends(check_admin)
+    db: Session = Depends(get_db), admin_username: str = Depends(check_admin)
 ):
     """Get current authentication and verification settings."""
     return SettingsService.get_auth_settings(db)
@@ -27,7 +42,7 @@ def get_auth_settings(
 def update_auth_settings(
     settings: AuthSettings,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_admin),
+    admin_username: str = Depends(check_admin),
 ):
     """Update authentication and verification settings."""
     return SettingsService.update_auth_settings(db, settings)
@@ -35,7 +50,7 @@ def update_auth_settings(
 
 @router.get("/settings/graph-db", response_model=GraphDBSettings)
 def get_graph_db_settings(
-    db: Session = Depends(get_db), current_user: User = Depends(check_admin)
+    db: Session = Depends(get_db), admin_username: str = Depends(check_admin)
 ):
     """
     Get current graph database settings.
@@ -50,7 +65,7 @@ def get_graph_db_settings(
 def update_graph_db_settings(
     settings: GraphDBSettings,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_admin),
+    admin_username: str = Depends(check_admin),
 ):
     """
     Update graph database settings.
@@ -61,11 +76,4 @@ def update_graph_db_settings(
     - **kuzu_db_path**: Path for Kuzu database storage
     - **nebula_***: NebulaGraph remote connection settings
     """
-    # Validate db_type
-    if settings.db_type not in ["kuzu", "nebula"]:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid db_type. Must be 'kuzu' or 'nebula'",
-        )
-
     return SettingsService.update_graph_db_settings(db, settings)
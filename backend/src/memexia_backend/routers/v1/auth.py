@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+import secrets
+import time
+from datetime import timedelta
+from jose import JWTError
 from jose.exceptions import ExpiredSignatureError
 
 from memexia_backend.database import get_db
@@ -20,6 +23,7 @@ from memexia_backend.utils.security import (
     verify_password,
     get_password_hash,
     create_access_token,
+    decode_token,
     verify_token_and_get_user,
 )
 from memexia_backend.config import settings
@@ -36,37 +40,43 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
 def get_user(db: Session, username: str):
-    return db.query(User).filter(User.username == username).first()
+    return db.execute(
+        select(User).where(User.username == username)
+    ).scalar_one_or_none()
+
+
+# Hash checked against when the username is unknown. Built once at import so
+# every unknown-user login costs exactly one verify_password, first one included.
+_DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(16))
 
 
 def authenticate_user(db: Session, username: str, password: str):
     user = get_user(db, username=username)
     if not user:
+        # Spend the same bcrypt time as a real check so response timing
+        # doesn't reveal which usernames exist
+        verify_password(password, _DUMMY_PASSWORD_HASH)
         return None
     if not verify_password(password, user.hashed_password):
         return None
     return user
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def get_token_username(token: str = Depends(oauth2_scheme)) -> str:
+    """Verify the bearer token and return the username it was issued to."""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
-        if not payload:
-            raise credentials_exception
-        sub = payload.get("sub")
+        sub = decode_token(token).get("sub")
         if sub is None or not isinstance(sub, str):
-            raise credentials_exception
-        username: str = sub
-        token_data = TokenData(username=username)
+            raise _credentials_exception()
+        token_data = TokenData(username=sub)
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,16 +84,27 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    return token_data.username
 
-    user = get_user(db, username=token_data.username)
+
+def get_current_user(
+    username: str = Depends(get_token_username), db: Session = Depends(get_db)
+):
+    # Sync so FastAPI runs the blocking user lookup in the threadpool
+    user = get_user(db, username=username)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 
 @router.post("/auth/register", response_model=UserSchema)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+def register(
+    user: UserCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     db_user = get_user(db, username=user.username)
     if db_user:
         raise HTTPException(status_code=400, detail="Username already registered")
@@ -118,7 +139,10 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
             data={"sub": db_user.username, "type": "email_verification"},
             expires_delta=expires_delta,
         )
-        send_verification_email(user.email, verification_token)
+        # Sent after the response so SMTP latency stays off the request path
+        background_tasks.add_task(send_verification_email, user.email, verification_token)
+
+    return db_user
 
 
 @router.post("/auth/verify-email")
@@ -135,7 +159,11 @@ def verify_email(token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/auth/forgot-password")
-def forgot_password(request: PasswordResetRequest, db: Session = Depends(get_db)):
+def forgot_password(
+    request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     auth_settings = SettingsService.get_auth_settings(db)
 
     user = None
@@ -147,7 +175,7 @@ def forgot_password(request: PasswordResetRequest, db: Session = Depends(get_db)
                 data={"sub": user.username, "type": "password_reset"},
                 expires_delta=expires_delta,
             )
-            send_password_reset_email(user.email, reset_token)
+            background_tasks.add_task(send_password_reset_email, user.email, reset_token)
             return {"message": "Password reset email sent"}
 
     # Add Phone/QQ logic here when implemented
@@ -189,7 +217,10 @@ def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db:
         data={"sub": user.username}, expires_delta=expires_delta
     )
 
-    expires_at = (datetime.now(timezone.utc) + expires_delta).isoformat() + "Z"
+    expires_at = time.strftime(
+        "%Y-%m-%dT%H:%M:%SZ",
+        time.gmtime(time.time() + expires_delta.total_seconds()),
+    )
 
     return {
         "access_token": access_token,
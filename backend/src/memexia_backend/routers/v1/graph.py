@@ -4,7 +4,7 @@ Graph API routes for retrieving full graph data.
 Each knowledge base has its own database/space for data isolation.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from memexia_backend.schemas import GraphData
 from memexia_backend.services import graph_service
 
@@ -12,6 +12,7 @@ router = APIRouter(
     prefix="/api/v1/graph",
     tags=["graph"],
     responses={404: {"description": "Not found"}},
+    dependencies=[Depends(graph_service.request_session_scope)],
 )
 
 
@@ -4,7 +4,10 @@ Knowledge Base API routes.
 This module provides REST API endpoints for knowledge base management.
 """
 
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from memexia_backend.database import get_db
@@ -24,6 +27,9 @@ from memexia_backend.utils.permissions import require_permission
 
 router = APIRouter(tags=["knowledge-bases"], prefix="/api/v1/knowledge-bases")
 
+# Validates a whole page of ORM rows in one pydantic-core call
+_KB_LIST_ADAPTER = TypeAdapter(List[KnowledgeBaseListItem])
+
 
 @router.get("", response_model=PaginatedKnowledgeBases)
 def list_knowledge_bases(
@@ -51,7 +57,7 @@ def list_knowledge_bases(
     total_pages = (total + page_size - 1) // page_size
 
     return PaginatedKnowledgeBases(
-        items=[KnowledgeBaseListItem.model_validate(item) for item in items],
+        items=_KB_LIST_ADAPTER.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -82,7 +88,7 @@ def list_my_knowledge_bases(
     total_pages = (total + page_size - 1) // page_size
 
     return PaginatedKnowledgeBases(
-        items=[KnowledgeBaseListItem.model_validate(item) for item in items],
+        items=_KB_LIST_ADAPTER.validate_python(items, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -141,7 +147,9 @@ def update_knowledge_base(
 
     Only owners and admins can update knowledge bases.
     """
-    kb = knowledge_base_service.get_by_id(db=db, kb_id=kb_id, user=current_user)
+    kb, allowed = knowledge_base_service.get_by_id_for_write(
+        db=db, kb_id=kb_id, user=current_user, permission=Permission.KB_UPDATE_ALL
+    )
 
     if not kb:
         raise HTTPException(
@@ -149,7 +157,7 @@ def update_knowledge_base(
             detail="Knowledge base not found",
         )
 
-    if not knowledge_base_service.can_modify(kb, current_user):
+    if not allowed:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to modify this knowledge base",
@@ -170,7 +178,9 @@ def delete_knowledge_base(
 
     Only owners and admins can delete knowledge bases.
     """
-    kb = knowledge_base_service.get_by_id(db=db, kb_id=kb_id, user=current_user)
+    kb, allowed = knowledge_base_service.get_by_id_for_write(
+        db=db, kb_id=kb_id, user=current_user, permission=Permission.KB_DELETE_ALL
+    )
 
     if not kb:
         raise HTTPException(
@@ -178,7 +188,7 @@ def delete_knowledge_base(
             detail="Knowledge base not found",
         )
 
-    if not knowledge_base_service.can_delete(kb, current_user):
+    if not allowed:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to delete this knowledge base",
@@ -4,7 +4,8 @@ Node API routes with knowledge base isolation.
 Each knowledge base has its own database/space for data isolation.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from chromadb.api.models.Collection import Collection
@@ -18,18 +19,20 @@ from memexia_backend.schemas import (
     Node,
     NodeCreate,
     NodeUpdate,
+    NodeBatchRequest,
     AIExpandRequest,
     GraphData,
 )
 from memexia_backend.services import graph_service, ai_service
 from memexia_backend.services.knowledge_base_service import knowledge_base_service
-from memexia_backend.models import User
+from memexia_backend.models import KnowledgeBase, User
 from memexia_backend.routers.v1.auth import get_current_user
 
 router = APIRouter(
     prefix="/api/v1/knowledge-bases/{kb_id}/nodes",
     tags=["nodes"],
     responses={404: {"description": "Not found"}},
+    dependencies=[Depends(graph_service.request_session_scope)],
 )
 
 
@@ -54,7 +57,14 @@ def get_kb_with_access(
     Raises:
         HTTPException: If not found or access denied
     """
-    kb = knowledge_base_service.get_by_id(db=db, kb_id=kb_id, user=current_user)
+    # The session is request-scoped, so its info dict doubles as a
+    # per-request cache of knowledge bases already loaded
+    kb_cache = db.info.setdefault("kb_cache", {})
+    if kb_id in kb_cache:
+        kb = kb_cache[kb_id]
+    else:
+        kb = knowledge_base_service.get_by_id(db=db, kb_id=kb_id, user=current_user)
+        kb_cache[kb_id] = kb
 
     if not kb:
         raise HTTPException(
@@ -72,21 +82,43 @@ def get_kb_with_access(
     return kb
 
 
+async def get_writable_kb_context(
+    kb_id: str,
+    db: SQLSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Tuple[KnowledgeBase, Collection]:
+    """
+    Resolve write access to a knowledge base and the ChromaDB collection.
+
+    Both lookups block, so they run concurrently in worker threads rather
+    than one dependency after the other.
+
+    Returns:
+        Tuple of (KnowledgeBase, ChromaDB collection)
+
+    Raises:
+        HTTPException: If not found or access denied
+    """
+    kb, collection = await asyncio.gather(
+        asyncio.to_thread(get_kb_with_access, kb_id, db, current_user, True),
+        asyncio.to_thread(get_chroma_collection),
+    )
+    return kb, collection
+
+
 @router.post("/", response_model=Node, status_code=status.HTTP_201_CREATED)
 def create_node(
     kb_id: str,
     node: NodeCreate,
-    db: SQLSession = Depends(get_db),
-    collection: Collection = Depends(get_chroma_collection),
-    current_user: User = Depends(get_current_user),
+    context: Tuple[KnowledgeBase, Collection] = Depends(get_writable_kb_context),
 ):
     """
     Create a new node in a knowledge base.
 
     Requires write access to the knowledge base.
     """
-    # Verify KB access
-    get_kb_with_access(kb_id, db, current_user, require_write=True)
+    # KB write access was verified by get_writable_kb_context
+    _, collection = context
 
     return graph_service.create_node(collection, node, kb_id)
 
@@ -108,6 +140,24 @@ def get_all_nodes(
     return graph_service.get_graph_data(kb_id)
 
 
+@router.post("/batch", response_model=List[Node])
+def read_nodes_batch(
+    kb_id: str,
+    batch: NodeBatchRequest,
+    db: SQLSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get several nodes in a knowledge base with a single graph query.
+
+    Missing node IDs are skipped.
+    """
+    # Verify KB access
+    get_kb_with_access(kb_id, db, current_user, require_write=False)
+
+    return graph_service.get_nodes(batch.node_ids, kb_id)
+
+
 @router.get("/{node_id}", response_model=Node)
 def read_node(
     kb_id: str,
@@ -153,17 +203,15 @@ def update_node(
 def delete_node(
     kb_id: str,
     node_id: str,
-    db: SQLSession = Depends(get_db),
-    collection: Collection = Depends(get_chroma_collection),
-    current_user: User = Depends(get_current_user),
+    context: Tuple[KnowledgeBase, Collection] = Depends(get_writable_kb_context),
 ):
     """
     Delete a node from a knowledge base.
 
     Requires write access to the knowledge base.
     """
-    # Verify KB access
-    get_kb_with_access(kb_id, db, current_user, require_write=True)
+    # KB write access was verified by get_writable_kb_context
+    _, collection = context
 
     deleted = graph_service.delete_node(collection, node_id, kb_id)
     if not deleted:
@@ -175,9 +223,7 @@ def expand_node(
     kb_id: str,
     node_id: str,
     request: AIExpandRequest,
-    db: SQLSession = Depends(get_db),
-    collection: Collection = Depends(get_chroma_collection),
-    current_user: User = Depends(get_current_user),
+    context: Tuple[KnowledgeBase, Collection] = Depends(get_writable_kb_context),
 ):
     """
     Expand a node using AI to generate related thoughts (synchronous).
@@ -186,8 +232,8 @@ def expand_node(
 
     Requires write access to the knowledge base.
     """
-    # Verify KB access
-    get_kb_with_access(kb_id, db, current_user, require_write=True)
+    # KB write access was verified by get_writable_kb_context
+    _, collection = context
 
     try:
         return ai_service.expand_node(collection, node_id, kb_id, request.instruction)
@@ -200,9 +246,7 @@ async def expand_node_stream(
     kb_id: str,
     node_id: str,
     request: AIExpandRequest,
-    db: SQLSession = Depends(get_db),
-    collection: Collection = Depends(get_chroma_collection),
-    current_user: User = Depends(get_current_user),
+    context: Tuple[KnowledgeBase, Collection] = Depends(get_writable_kb_context),
 ):
     """
     Expand a node using AI with Server-Sent Events streaming.
@@ -234,11 +278,11 @@ async def expand_node_stream(
 
     Requires write access to the knowledge base.
     """
-    # Verify KB access
-    get_kb_with_access(kb_id, db, current_user, require_write=True)
+    # KB write access was verified by get_writable_kb_context
+    _, collection = context
 
-    # Verify node exists
-    existing_node = graph_service.get_node(node_id, kb_id)
+    # Verify node exists (graph backends are synchronous)
+    existing_node = await asyncio.to_thread(graph_service.get_node, node_id, kb_id)
     if not existing_node:
         raise HTTPException(status_code=404, detail="Node not found")
 
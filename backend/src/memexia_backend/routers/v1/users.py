@@ -5,33 +5,139 @@ This module provides REST API endpoints for user management,
 accessible only to administrators.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from typing import List, NoReturn, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from memexia_backend.database import get_db
 from memexia_backend.models import User
 from memexia_backend.schemas import UserList, UserRoleUpdate, User as UserSchema
 from memexia_backend.enums import Permission, UserRole
-from memexia_backend.utils.permissions import require_permission
+from memexia_backend.utils.cache import TTLCache
+from memexia_backend.utils.permissions import invalidate_admin_cache, require_permission
 
 router = APIRouter(tags=["users"], prefix="/api/v1/users")
 
+# Responses are serialized straight to JSON bytes in pydantic-core and
+# returned as-is, skipping FastAPI's second pass through response_model
+# (which stays on each route for the OpenAPI schema)
+_USER_ADAPTER = TypeAdapter(UserSchema)
+_USER_LIST_ADAPTER = TypeAdapter(List[UserList])
+
+# Columns backing each response schema. Fields UserList may gain that are
+# not columns (e.g. counts) belong here too, as labelled SQL aggregates.
+_USER_RESPONSE_COLUMNS = [User.__table__.c[name] for name in UserSchema.model_fields]
+_USER_LIST_COLUMNS = [User.__table__.c[name] for name in UserList.model_fields]
+
+# Response schemas only read scalar columns; any relationship access during
+# serialization should fail loudly rather than issue a hidden query
+_SCALARS_ONLY = [raiseload("*")]
+
+# Serialized read responses, keyed by ("list", skip, limit, after) or
+# ("detail", user_id). Permission checks still run on every request.
+# Writes below clear it; sign-ups and verifications elsewhere show up once
+# the TTL lapses.
+_response_cache = TTLCache(maxsize=256, ttl=15)
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap already-serialized JSON in a response."""
+    return Response(content=body, media_type="application/json")
+
+
+def _invalidate_user(username: str) -> None:
+    """Drop cached responses and admin status after a user changes."""
+    _response_cache.clear()
+    invalidate_admin_cache(username)
+
+
+def _update_user_returning(
+    db: Session,
+    user_id: int,
+    values: dict,
+    protect_id: Optional[int] = None,
+) -> Optional[UserSchema]:
+    """
+    Update a user with a single UPDATE ... RETURNING statement.
+
+    Args:
+        db: Database session
+        user_id: ID of the user to update
+        values: Column values to set
+        protect_id: If given, leave superusers and this user ID untouched
+
+    Returns:
+        Response for the updated user, or None if no row matched
+    """
+    stmt = update(User).where(User.id == user_id)
+    if protect_id is not None:
+        stmt = stmt.where(User.is_superuser.is_(False), User.id != protect_id)
+
+    row = db.execute(
+        stmt.values(**values).returning(*_USER_RESPONSE_COLUMNS)
+    ).one_or_none()
+    if row is None:
+        return None
+
+    db.commit()
+    # Values come straight from the row just written, so skip re-validation
+    result = UserSchema.model_construct(**row._mapping)
+    _invalidate_user(result.username)
+    return result
+
+
+def _raise_update_refused(db: Session, user_id: int, superuser_detail: str) -> NoReturn:
+    """Explain why a guarded update matched no row (only runs on failure)."""
+    if db.get(User, user_id, options=_SCALARS_ONLY) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=superuser_detail,
+    )
+
 
 @router.get("", response_model=List[UserList])
 def list_users(
     skip: int = Query(0, ge=0, description="Number of users to skip"),
     limit: int = Query(100, ge=1, le=100, description="Maximum users to return"),
+    after: Optional[int] = Query(
+        None, ge=0, description="Return users with an ID above this one (overrides skip)"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_permission(Permission.USER_READ_ALL)),
 ):
     """
-    List all users (admin only).
+    List all users (admin only), ordered by ID.
+
+    Pass the last ID of the previous page as `after` to page by key, which
+    stays fast however deep the page; `skip` is kept for existing clients.
 
     Requires USER_READ_ALL permission.
     """
-    users = db.query(User).offset(skip).limit(limit).all()
-    return [UserList.model_validate(user) for user in users]
+    cache_key = ("list", skip, limit, after)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    # Select just the listed columns; rows validate by attribute like ORM
+    # objects without the cost of building and tracking User instances
+    query = select(*_USER_LIST_COLUMNS).order_by(User.id).limit(limit)
+    if after is not None:
+        query = query.where(User.id > after)
+    else:
+        query = query.offset(skip)
+
+    rows = db.execute(query).all()
+    body = _USER_LIST_ADAPTER.dump_json(
+        _USER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    )
+    _response_cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.get("/{user_id}", response_model=UserSchema)
@@ -45,7 +151,12 @@ def get_user(
 
     Requires USER_READ_ALL permission.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    cache_key = ("detail", user_id)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    user = db.get(User, user_id, options=_SCALARS_ONLY)
 
     if not user:
         raise HTTPException(
@@ -53,7 +164,9 @@ def get_user(
             detail="User not found",
         )
 
-    return UserSchema.model_validate(user)
+    body = _USER_ADAPTER.dump_json(UserSchema.model_validate(user))
+    _response_cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.patch("/{user_id}/role", response_model=UserSchema)
@@ -70,34 +183,27 @@ def update_user_role(
 
     Note: Cannot modify superuser accounts or own account.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-
-    # Prevent self-modification
-    if user.id == current_user.id:
+    # Reject self-edits before touching the database
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot modify your own role",
         )
 
-    # Prevent modification of superusers
-    if user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot modify superuser accounts",
+    result = _update_user_returning(
+        db,
+        user_id,
+        {"role": role_update.role.value},
+        protect_id=current_user.id,
+    )
+    if result is None:
+        _raise_update_refused(
+            db,
+            user_id,
+            superuser_detail="Cannot modify superuser accounts",
         )
 
-    # Update role
-    user.role = role_update.role.value
-    db.commit()
-    db.refresh(user)
-
-    return UserSchema.model_validate(user)
+    return _json_response(_USER_ADAPTER.dump_json(result))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -114,7 +220,14 @@ def delete_user(
     Note: Cannot delete superuser accounts or own account.
     This will also delete all the user's knowledge bases.
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    # Reject self-edits before touching the database
+    if user_id == current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete your own account",
+        )
+
+    user = db.get(User, user_id, options=[selectinload(User.knowledge_bases)])
 
     if not user:
         raise HTTPException(
@@ -122,13 +235,6 @@ def delete_user(
             detail="User not found",
         )
 
-    # Prevent self-deletion
-    if user.id == current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete your own account",
-        )
-
     # Prevent deletion of superusers
     if user.is_superuser:
         raise HTTPException(
@@ -137,8 +243,10 @@ def delete_user(
         )
 
     # Delete user (cascade will delete knowledge bases)
+    username = user.username
     db.delete(user)
     db.commit()
+    _invalidate_user(username)
 
 
 @router.patch("/{user_id}/activate", response_model=UserSchema)
@@ -150,19 +258,14 @@ def activate_user(
     """
     Activate a deactivated user (admin only).
     """
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user:
+    result = _update_user_returning(db, user_id, {"is_active": True})
+    if result is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
 
-    user.is_active = True
-    db.commit()
-    db.refresh(user)
-
-    return UserSchema.model_validate(user)
+    return _json_response(_USER_ADAPTER.dump_json(result))
 
 
 @router.patch("/{user_id}/deactivate", response_model=UserSchema)
@@ -176,30 +279,21 @@ def deactivate_user(
 
     Deactivated users cannot log in.
     """
-    user = db.query(User).filter(User.id == user_id).first()
-
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
-
-    # Prevent self-deactivation
-    if user.id == current_user.id:
+    # Reject self-edits before touching the database
+    if user_id == current_user.id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot deactivate your own account",
         )
 
-    # Prevent deactivation of superusers
-    if user.is_superuser:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot deactivate superuser accounts",
+    result = _update_user_returning(
+        db, user_id, {"is_active": False}, protect_id=current_user.id
+    )
+    if result is None:
+        _raise_update_refused(
+            db,
+            user_id,
+            superuser_detail="Cannot deactivate superuser accounts",
         )
 
-    user.is_active = False
-    db.commit()
-    db.refresh(user)
-
-    return UserSchema.model_validate(user)
+    return _json_response(_USER_ADAPTER.dump_json(result))
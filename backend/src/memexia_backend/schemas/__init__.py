@@ -1,4 +1,4 @@
-from .node import Node, NodeCreate, NodeUpdate
+from .node import Node, NodeCreate, NodeUpdate, NodeBatchRequest
 from .edge import Edge, EdgeCreate
 from .graph import GraphData
 from .ai import AIExpandRequest, AIChatRequest
@@ -34,6 +34,7 @@ __all__ = [
     "Node",
     "NodeCreate",
     "NodeUpdate",
+    "NodeBatchRequest",
     "Edge",
     "EdgeCreate",
     "GraphData",
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, computed_field
 from typing import Optional
 
 class EdgeBase(BaseModel):
@@ -11,7 +11,10 @@ class EdgeCreate(EdgeBase):
     pass
 
 class Edge(EdgeBase):
-    id: str
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
-    class Config:
-        from_attributes = True
+    @computed_field
+    @property
+    def id(self) -> str:
+        # Built only when serialized; the graph stores no separate edge ID
+        return f"{self.source_id}->{self.target_id}"
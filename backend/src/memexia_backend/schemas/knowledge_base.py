@@ -2,7 +2,7 @@
 KnowledgeBase schemas for API request/response validation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -54,8 +54,7 @@ class KnowledgeBaseResponse(KnowledgeBaseBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class KnowledgeBaseListItem(BaseModel):
@@ -68,8 +67,7 @@ class KnowledgeBaseListItem(BaseModel):
     is_public: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class KnowledgeBaseWithOwner(KnowledgeBaseResponse):
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class NodeBase(BaseModel):
     content: str
@@ -18,5 +18,8 @@ class Node(NodeBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+class NodeBatchRequest(BaseModel):
+    """Request body for fetching several nodes at once."""
+    node_ids: List[str] = Field(..., min_length=1, max_length=500)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, Any, Dict
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Any, Dict, Literal
 
 class SystemSettingBase(BaseModel):
     key: str
@@ -14,8 +14,7 @@ class SystemSettingUpdate(BaseModel):
     description: Optional[str] = None
 
 class SystemSetting(SystemSettingBase):
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class AuthSettings(BaseModel):
     enable_email: bool = False
@@ -30,7 +29,7 @@ class GraphDBSettings(BaseModel):
     """Graph database configuration settings."""
 
     # Database type: "kuzu" (embedded, default) or "nebula" (remote)
-    db_type: str = "kuzu"
+    db_type: Literal["kuzu", "nebula"] = "kuzu"
 
     # Kuzu settings (embedded graph database)
     kuzu_db_path: str = "./data/kuzu_db"
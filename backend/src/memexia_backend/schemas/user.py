@@ -1,27 +1,35 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict
+from typing import Annotated, Optional
 from datetime import datetime
 import re
+from functools import lru_cache
 
 from memexia_backend.enums import UserRole
 
 
+# Basic email pattern that allows .local domains
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+# RFC 5321 path limit; also bounds the regex's backtracking on hostile input
+_EMAIL_MAX_LENGTH = 254
+
+
+@lru_cache(maxsize=4096)
+def _validate_email(v: str) -> str:
+    """Custom email validator that allows .local domains."""
+    if len(v) > _EMAIL_MAX_LENGTH or not _EMAIL_RE.match(v):
+        raise ValueError('Invalid email address')
+    return v.lower()
+
+
+Email = Annotated[str, AfterValidator(_validate_email)]
+
+
 class UserBase(BaseModel):
     """Base user schema with common fields."""
 
-    email: str
+    email: Email
     username: str = Field(..., min_length=3, max_length=50)
 
-    @field_validator('email')
-    @classmethod
-    def validate_email(cls, v: str) -> str:
-        """Custom email validator that allows .local domains."""
-        # Basic email pattern that allows .local domains
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, v):
-            raise ValueError('Invalid email address')
-        return v.lower()
-
 
 class UserCreate(UserBase):
     """Schema for user registration."""
@@ -39,20 +47,9 @@ class UserLogin(BaseModel):
 class UserUpdate(BaseModel):
     """Schema for updating user profile (self)."""
 
-    email: Optional[str] = None
+    email: Optional[Email] = None
     username: Optional[str] = Field(None, min_length=3, max_length=50)
 
-    @field_validator('email')
-    @classmethod
-    def validate_email(cls, v: Optional[str]) -> Optional[str]:
-        """Custom email validator that allows .local domains."""
-        if v is None:
-            return v
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, v):
-            raise ValueError('Invalid email address')
-        return v.lower()
-
 
 class UserRoleUpdate(BaseModel):
     """Schema for admin to update user role."""
@@ -65,6 +62,7 @@ class Token(BaseModel):
 
     access_token: str
     token_type: str
+    expires_at: Optional[str] = None  # UTC ISO 8601, e.g. "2025-01-01T12:00:00Z"
 
 
 class TokenData(BaseModel):
@@ -83,15 +81,14 @@ class User(UserBase):
     is_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserList(BaseModel):
     """User list item schema (for admin view)."""
 
     id: int
-    email: str
+    email: Email
     username: str
     role: str
     is_superuser: bool
@@ -99,14 +96,4 @@ class UserList(BaseModel):
     is_verified: bool
     created_at: datetime
 
-    @field_validator('email')
-    @classmethod
-    def validate_email(cls, v: str) -> str:
-        """Custom email validator that allows .local domains."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(pattern, v):
-            raise ValueError('Invalid email address')
-        return v.lower()
-
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -4,15 +4,262 @@ AI service for node expansion and intelligent features.
 Implements OpenAI-compatible API integration with streaming support.
 """
 
-import json
-import random
-from typing import Any, AsyncGenerator, Optional
+import asyncio
+import hashlib
+import time
+import zlib
+from functools import lru_cache
+from typing import Any, AsyncGenerator, List, Optional, Tuple
+import httpx
+import orjson
 from openai import AsyncOpenAI
 from loguru import logger
 
 from memexia_backend.config import settings
-from memexia_backend.schemas import NodeCreate, EdgeCreate
+from memexia_backend.database import get_ai_cache_collection
+from memexia_backend.schemas import Node, NodeCreate, EdgeCreate
 from . import graph_service
+from .embedding_service import embedding_service
+
+
+def _sse(payload: dict) -> bytes:
+    """Encode one SSE data frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+
+def _sse_chunk(content: str) -> bytes:
+    """Encode a streamed text chunk, the most frequent event."""
+    return b'data: {"type":"chunk","content":' + orjson.dumps(content) + b"}\n\n"
+
+
+def _node_created_event(node: Node, relation: str) -> bytes:
+    """Encode the event announcing a created node."""
+    return _sse({
+        "type": "node_created",
+        "node": {"id": node.id, "content": node.content, "node_type": node.node_type},
+        "relation": relation,
+    })
+
+
+def _edge_weight(source_id: str, content: str, low: int = 3, high: int = 5) -> int:
+    """
+    Weight for an AI-generated edge, in [low, high].
+
+    Derived from the source node and the generated text rather than drawn at
+    random, so replaying the same expansion yields the same weights.
+    """
+    return low + zlib.crc32(f"{source_id}|{content}".encode()) % (high - low + 1)
+
+
+# Streamed deltas per chunk event: 1, 3, 9, 27, then capped
+_CHUNK_BATCH_GROWTH = 3
+_CHUNK_BATCH_MAX = 50
+
+# Fixed-payload events, encoded once
+_SSE_THINKING = _sse({"type": "thinking", "message": "AI is analyzing the concept..."})
+_SSE_PARSING = _sse({"type": "parsing", "message": "Creating new nodes..."})
+
+
+class _SemanticCache:
+    """
+    Expansion results keyed by the embedding of their request.
+
+    A request whose content embedding lies within AI_CACHE_MIN_SIMILARITY of
+    a stored one, in the same knowledge base, with the same instruction and
+    model and within AI_CACHE_TTL_SECONDS, reuses that result instead of
+    calling the model. Off unless AI_CACHE_TTL_SECONDS is set.
+    Methods are synchronous; call them via asyncio.to_thread.
+    """
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.AI_CACHE_TTL_SECONDS > 0
+
+    @staticmethod
+    def embed(source_content: str) -> List[float]:
+        return embedding_service.generate_embedding(source_content)
+
+    @staticmethod
+    def lookup(
+        embedding: List[float],
+        knowledge_base_id: str,
+        instruction: Optional[str],
+    ) -> Optional[List[dict]]:
+        """Return cached concepts for a similar request, or None."""
+        results = get_ai_cache_collection().query(
+            query_embeddings=[embedding],
+            n_results=1,
+            where={
+                "$and": [
+                    {"knowledge_base_id": knowledge_base_id},
+                    {"instruction": instruction or ""},
+                    {"model": settings.OPENAI_MODEL},
+                    {"created_at": {"$gte": time.time() - settings.AI_CACHE_TTL_SECONDS}},
+                ]
+            },
+            include=["metadatas", "distances"],
+        )
+        if not results["ids"] or not results["ids"][0]:
+            return None
+
+        # Collection uses cosine distance, so similarity = 1 - distance
+        if 1 - results["distances"][0][0] < settings.AI_CACHE_MIN_SIMILARITY:
+            return None
+        return orjson.loads(results["metadatas"][0][0]["concepts"])
+
+    @staticmethod
+    def store(
+        embedding: List[float],
+        knowledge_base_id: str,
+        source_content: str,
+        instruction: Optional[str],
+        concepts: List[dict],
+    ) -> None:
+        key = f"{settings.OPENAI_MODEL}|{knowledge_base_id}|{source_content}|{instruction or ''}"
+        get_ai_cache_collection().upsert(
+            ids=[hashlib.sha256(key.encode()).hexdigest()],
+            embeddings=[embedding],
+            documents=[source_content],
+            metadatas=[
+                {
+                    "knowledge_base_id": knowledge_base_id,
+                    "instruction": instruction or "",
+                    "model": settings.OPENAI_MODEL,
+                    "concepts": orjson.dumps(concepts).decode(),
+                    "created_at": time.time(),
+                }
+            ],
+        )
+
+
+# Fixed instructions sent as the system message. Everything request-specific
+# goes in the user message after it, so providers that cache prompts by
+# shared prefix can reuse this part across calls.
+_EXPANSION_SYSTEM_PROMPT = """You are an intelligent knowledge expansion assistant. Your task is to generate related concepts based on the given node content.
+
+Generate exactly 3 related concepts that:
+1. Are logically connected to the source concept
+2. Provide new perspectives or deeper understanding
+3. Are concise but informative (1-2 sentences each)
+
+If the user gives an additional instruction, follow it as long as the response keeps the structure below.
+
+Respond in JSON format with the following structure:
+{
+    "concepts": [
+        {
+            "content": "The concept description",
+            "relation": "How this relates to the source (e.g., 'is a type of', 'is caused by', 'leads to')"
+        }
+    ]
+}
+
+Only respond with valid JSON, no additional text."""
+
+
+# Structured-outputs schema matching the format the system prompt asks for;
+# the provider then only samples valid JSON in this shape
+_EXPANSION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "concepts",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "concepts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "content": {"type": "string"},
+                            "relation": {"type": "string"},
+                        },
+                        "required": ["content", "relation"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["concepts"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Fixed pieces of the user message, joined around the request's text
+_USER_MESSAGE_PREFIX = 'Given node content: "'
+_USER_MESSAGE_SUFFIX = '"'
+_USER_MESSAGE_INSTRUCTION = '"\n\nAdditional instruction: '
+
+
+@lru_cache(maxsize=1024)
+def _build_user_message(source_content: str, instruction: Optional[str] = None) -> str:
+    """
+    Build the per-request part of the expansion prompt.
+
+    Memoized so retries and repeated expansions of a node reuse the string.
+    """
+    if instruction:
+        return "".join((
+            _USER_MESSAGE_PREFIX,
+            source_content,
+            _USER_MESSAGE_INSTRUCTION,
+            instruction,
+        ))
+    return "".join((_USER_MESSAGE_PREFIX, source_content, _USER_MESSAGE_SUFFIX))
+
+
+class _ConceptStreamParser:
+    """
+    Pull concept objects out of a streamed {"concepts": [...]} response.
+
+    feed() takes each text delta and returns the concepts whose closing
+    brace has arrived, tracking nesting and string state across deltas.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._item_start = -1
+
+    def feed(self, text: str) -> List[dict]:
+        start = len(self._buffer)
+        self._buffer += text
+        items = []
+
+        for i in range(start, len(self._buffer)):
+            ch = self._buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                # An object directly inside the top-level object's array
+                if ch == "{" and self._stack == ["{", "["]:
+                    self._item_start = i
+                self._stack.append(ch)
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+                if ch == "}" and self._stack == ["{", "["] and self._item_start >= 0:
+                    try:
+                        item = orjson.loads(self._buffer[self._item_start:i + 1])
+                    except orjson.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict):
+                        items.append(item)
+                    self._item_start = -1
+
+        return items
 
 
 class AIService:
@@ -21,48 +268,100 @@ class AIService:
     def __init__(self):
         """Initialize the OpenAI client."""
         self._client: Optional[AsyncOpenAI] = None
+        self._http: Optional[httpx.AsyncClient] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazy initialization of OpenAI client."""
+        """
+        Lazy initialization of OpenAI client.
+
+        Every request shares one connection pool, so streams after the first
+        reuse warm keep-alive connections instead of a new TLS handshake.
+        """
         if self._client is None:
             if not settings.OPENAI_API_KEY:
                 raise ValueError("OPENAI_API_KEY is not configured")
+            self._http = httpx.AsyncClient(
+                http2=settings.OPENAI_HTTP2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=settings.OPENAI_POOL_KEEPALIVE,
+                    max_connections=settings.OPENAI_POOL_MAX,
+                ),
+                timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+            )
             self._client = AsyncOpenAI(
                 api_key=settings.OPENAI_API_KEY,
                 base_url=settings.OPENAI_BASE_URL,
+                http_client=self._http,
             )
         return self._client
 
-    def _build_expansion_prompt(
-        self,
-        source_content: str,
-        instruction: Optional[str] = None,
-    ) -> str:
-        """Build the system prompt for node expansion."""
-        base_prompt = f"""You are an intelligent knowledge expansion assistant. Your task is to generate related concepts based on the given node content.
-
-Given node content: "{source_content}"
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._client = None
 
-Generate exactly 3 related concepts that:
-1. Are logically connected to the source concept
-2. Provide new perspectives or deeper understanding
-3. Are concise but informative (1-2 sentences each)
-
-{f'Additional instruction: {instruction}' if instruction else ''}
+    async def _persist_concepts(
+        self,
+        collection: Any,
+        source_node: Any,
+        knowledge_base_id: str,
+        concepts: List[dict],
+    ) -> List[Tuple[Node, str]]:
+        """
+        Create a node and edge per concept in one bulk write.
 
-Respond in JSON format with the following structure:
-{{
-    "concepts": [
-        {{
-            "content": "The concept description",
-            "relation": "How this relates to the source (e.g., 'is a type of', 'is caused by', 'leads to')"
-        }}
-    ]
-}}
+        Returns:
+            (created Node, relation type) pairs
+        """
+        links = []
+        for concept in concepts:
+            content = concept.get("content", "")
+            relation = concept.get("relation", "related_to")
+
+            if not content:
+                continue
+
+            links.append((
+                NodeCreate(content=content, node_type="generated"),
+                relation if isinstance(relation, str) else "ai_generated",
+                _edge_weight(source_node.id, content),
+            ))
+
+        write = asyncio.ensure_future(asyncio.to_thread(
+            graph_service.create_linked_nodes,
+            collection,
+            source_node.id,
+            links,
+            knowledge_base_id,
+        ))
+        try:
+            return await asyncio.shield(write)
+        except asyncio.CancelledError:
+            # The worker thread can't be interrupted; let it finish before
+            # the caller hands the graph session back
+            await asyncio.wait([write])
+            raise
+
+    async def _create_concept_nodes(
+        self,
+        collection: Any,
+        source_node: Any,
+        knowledge_base_id: str,
+        concepts: List[dict],
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Create a node and edge per concept, yielding node_created events.
 
-Only respond with valid JSON, no additional text."""
-        return base_prompt
+        Everything is written in one bulk call before the events are sent.
+        """
+        created_nodes = await self._persist_concepts(
+            collection, source_node, knowledge_base_id, concepts
+        )
+        for new_node, relation in created_nodes:
+            yield _node_created_event(new_node, relation)
 
     async def expand_node_stream(
         self,
@@ -70,11 +369,13 @@ Only respond with valid JSON, no additional text."""
         node_id: str,
         knowledge_base_id: str,
         instruction: Optional[str] = None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Stream AI expansion of a node using OpenAI API.
 
-        Yields SSE-formatted events for real-time updates.
+        Yields SSE-formatted events for real-time updates. Each concept is
+        persisted as soon as its JSON object is complete in the stream,
+        while the model is still writing the rest.
 
         Args:
             collection: ChromaDB collection
@@ -83,15 +384,22 @@ Only respond with valid JSON, no additional text."""
             instruction: Optional instruction for expansion
 
         Yields:
-            SSE event strings
+            SSE event frames
         """
-        source_node = graph_service.get_node(node_id, knowledge_base_id)
+        # Graph backends are synchronous; keep them off the event loop
+        source_node = await asyncio.to_thread(
+            graph_service.get_node, node_id, knowledge_base_id
+        )
         if not source_node:
-            yield f"data: {json.dumps({'type': 'error', 'message': 'Node not found'})}\n\n"
+            yield _sse({'type': 'error', 'message': 'Node not found'})
             return
 
         # Send start event
-        yield f"data: {json.dumps({'type': 'start', 'source_node': {'id': source_node.id, 'content': source_node.content}})}\n\n"
+        yield _sse({'type': 'start', 'source_node': {'id': source_node.id, 'content': source_node.content}})
+
+        # Concepts are written by a background task while the stream keeps
+        # being read (see below)
+        persist_task: Optional[asyncio.Task] = None
 
         try:
             # Check if API key is configured
@@ -103,83 +411,163 @@ Only respond with valid JSON, no additional text."""
                     yield event
                 return
 
+            # Replay a stored result for a near-identical earlier request
+            cache_embedding = None
+            if _SemanticCache.enabled():
+                try:
+                    cache_embedding = await asyncio.to_thread(
+                        _SemanticCache.embed, source_node.content
+                    )
+                    cached_concepts = await asyncio.to_thread(
+                        _SemanticCache.lookup, cache_embedding, knowledge_base_id, instruction
+                    )
+                except Exception as e:
+                    logger.warning(f"AI cache lookup failed: {e}")
+                    cached_concepts = None
+
+                if cached_concepts is not None:
+                    logger.debug(f"AI cache hit for node {node_id}")
+                    for concept in cached_concepts:
+                        yield _sse_chunk(concept.get('content', ''))
+                    yield _SSE_PARSING
+                    total_nodes = 0
+                    async for event in self._create_concept_nodes(
+                        collection, source_node, knowledge_base_id, cached_concepts
+                    ):
+                        total_nodes += 1
+                        yield event
+                    yield _sse({'type': 'complete', 'total_nodes': total_nodes})
+                    return
+
             # Build prompt and call OpenAI
-            prompt = self._build_expansion_prompt(source_node.content, instruction)
+            user_message = _build_user_message(source_node.content, instruction)
 
             # Stream the response
             full_response = ""
-            yield f"data: {json.dumps({'type': 'thinking', 'message': 'AI is analyzing the concept...'})}\n\n"
+            yield _SSE_THINKING
+
+            extra_params = {}
+            if settings.OPENAI_STRUCTURED_OUTPUT:
+                extra_params["response_format"] = _EXPANSION_RESPONSE_FORMAT
 
             stream = await self.client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are a helpful knowledge expansion assistant."},
-                    {"role": "user", "content": prompt},
+                    {"role": "system", "content": _EXPANSION_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message},
                 ],
                 max_tokens=settings.OPENAI_MAX_TOKENS,
                 temperature=settings.OPENAI_TEMPERATURE,
                 stream=True,
+                **extra_params,
             )
 
+            parser = _ConceptStreamParser()
+            concepts: List[dict] = []
+            total_nodes = 0
+
+            # Writes share the request's graph session, so only one runs at
+            # a time; concepts completed meanwhile queue up and go out
+            # together in the next write.
+            queued: List[dict] = []
+
+            # Deltas are coalesced into chunk events: the first goes out
+            # alone for a fast first paint, then batches grow geometrically
+            pending: List[str] = []
+            batch_size = 1
+
             async for chunk in stream:
                 if chunk.choices and chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
                     full_response += content
-                    yield f"data: {json.dumps({'type': 'chunk', 'content': content})}\n\n"
-
-            # Parse the response and create nodes
-            yield f"data: {json.dumps({'type': 'parsing', 'message': 'Creating new nodes...'})}\n\n"
+                    pending.append(content)
+
+                    completed = parser.feed(content)
+
+                    if len(pending) >= batch_size or completed:
+                        yield _sse_chunk("".join(pending))
+                        pending.clear()
+                        batch_size = min(_CHUNK_BATCH_MAX, batch_size * _CHUNK_BATCH_GROWTH)
+
+                    if completed and not concepts:
+                        yield _SSE_PARSING
+                    concepts.extend(completed)
+                    queued.extend(completed)
+
+                # Report a finished write, then start one for queued concepts
+                if persist_task is not None and persist_task.done():
+                    for new_node, relation in persist_task.result():
+                        total_nodes += 1
+                        yield _node_created_event(new_node, relation)
+                    persist_task = None
+                if persist_task is None and queued:
+                    persist_task = asyncio.create_task(self._persist_concepts(
+                        collection, source_node, knowledge_base_id, queued
+                    ))
+                    queued = []
+
+            if pending:
+                yield _sse_chunk("".join(pending))
+
+            # Drain the write in flight and whatever queued behind it
+            while persist_task is not None:
+                for new_node, relation in await persist_task:
+                    total_nodes += 1
+                    yield _node_created_event(new_node, relation)
+                persist_task = None
+                if queued:
+                    persist_task = asyncio.create_task(self._persist_concepts(
+                        collection, source_node, knowledge_base_id, queued
+                    ))
+                    queued = []
 
             try:
-                # Try to extract JSON from the response
-                json_start = full_response.find("{")
-                json_end = full_response.rfind("}") + 1
-                if json_start >= 0 and json_end > json_start:
-                    json_str = full_response[json_start:json_end]
-                    parsed = json.loads(json_str)
-                    concepts = parsed.get("concepts", [])
-                else:
-                    raise ValueError("No valid JSON found in response")
-
-                created_nodes = []
-                for concept in concepts:
-                    content = concept.get("content", "")
-                    relation = concept.get("relation", "related_to")
-
-                    if not content:
-                        continue
-
-                    # Create new node
-                    new_node_data = NodeCreate(content=content, node_type="generated")
-                    new_node = graph_service.create_node(
-                        collection, new_node_data, knowledge_base_id
-                    )
-                    created_nodes.append(new_node)
-
-                    # Create edge
-                    edge_data = EdgeCreate(
-                        source_id=source_node.id,
-                        target_id=new_node.id,
-                        relation_type=relation if isinstance(relation, str) else "ai_generated",
-                        weight=random.randint(3, 5),
-                    )
-                    graph_service.create_edge(edge_data, knowledge_base_id)
-
-                    # Send node created event
-                    yield f"data: {json.dumps({'type': 'node_created', 'node': {'id': new_node.id, 'content': new_node.content, 'node_type': new_node.node_type}, 'relation': relation})}\n\n"
+                if not concepts:
+                    # Nothing parsed mid-stream; try the whole response once.
+                    # Only reachable for models that ignore structured outputs
+                    # or when it is disabled.
+                    yield _SSE_PARSING
+
+                    json_start = full_response.find("{")
+                    json_end = full_response.rfind("}") + 1
+                    if json_start >= 0 and json_end > json_start:
+                        json_str = full_response[json_start:json_end]
+                        parsed = orjson.loads(json_str)
+                        concepts = parsed.get("concepts", [])
+                    else:
+                        raise ValueError("No valid JSON found in response")
+
+                    async for event in self._create_concept_nodes(
+                        collection, source_node, knowledge_base_id, concepts
+                    ):
+                        total_nodes += 1
+                        yield event
+
+                if cache_embedding is not None and concepts:
+                    try:
+                        await asyncio.to_thread(
+                            _SemanticCache.store,
+                            cache_embedding,
+                            knowledge_base_id,
+                            source_node.content,
+                            instruction,
+                            concepts,
+                        )
+                    except Exception as e:
+                        logger.warning(f"AI cache store failed: {e}")
 
                 # Send completion event
-                yield f"data: {json.dumps({'type': 'complete', 'total_nodes': len(created_nodes)})}\n\n"
+                yield _sse({'type': 'complete', 'total_nodes': total_nodes})
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.error(f"Failed to parse AI response: {e}")
                 # Fallback: create a single node with the response
                 new_node_data = NodeCreate(
                     content=full_response[:500] if len(full_response) > 500 else full_response,
                     node_type="generated",
                 )
-                new_node = graph_service.create_node(
-                    collection, new_node_data, knowledge_base_id
+                new_node = await asyncio.to_thread(
+                    graph_service.create_node, collection, new_node_data, knowledge_base_id
                 )
 
                 edge_data = EdgeCreate(
@@ -188,14 +576,27 @@ Only respond with valid JSON, no additional text."""
                     relation_type="ai_generated",
                     weight=3,
                 )
-                graph_service.create_edge(edge_data, knowledge_base_id)
+                await asyncio.to_thread(graph_service.create_edge, edge_data, knowledge_base_id)
 
-                yield f"data: {json.dumps({'type': 'node_created', 'node': {'id': new_node.id, 'content': new_node.content, 'node_type': new_node.node_type}, 'relation': 'ai_generated'})}\n\n"
-                yield f"data: {json.dumps({'type': 'complete', 'total_nodes': 1})}\n\n"
+                yield _node_created_event(new_node, "ai_generated")
+                yield _sse({'type': 'complete', 'total_nodes': 1})
 
         except Exception as e:
             logger.error(f"AI expansion error: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield _sse({'type': 'error', 'message': str(e)})
+
+        finally:
+            # The stream can end early (client disconnect, API error); don't
+            # leave a write running on the request's graph session after the
+            # request scope returns it
+            if persist_task is not None:
+                persist_task.cancel()
+                try:
+                    await persist_task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.error(f"AI expansion write failed: {e}")
 
     async def _mock_expand_stream(
         self,
@@ -203,15 +604,13 @@ Only respond with valid JSON, no additional text."""
         source_node: Any,
         knowledge_base_id: str,
         instruction: Optional[str] = None,
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[bytes, None]:
         """
         Mock expansion for testing without OpenAI API.
 
         Used when OPENAI_API_KEY is not configured.
         """
-        import asyncio
-
-        yield f"data: {json.dumps({'type': 'thinking', 'message': 'AI is analyzing the concept... (mock mode)'})}\n\n"
+        yield _sse({'type': 'thinking', 'message': 'AI is analyzing the concept... (mock mode)'})
         await asyncio.sleep(0.5)
 
         # Generate mock concepts
@@ -223,32 +622,20 @@ Only respond with valid JSON, no additional text."""
 
         # Simulate streaming chunks
         for concept in mock_concepts:
-            yield f"data: {json.dumps({'type': 'chunk', 'content': concept['content']})}\n\n"
+            yield _sse_chunk(concept['content'])
             await asyncio.sleep(0.3)
 
-        yield f"data: {json.dumps({'type': 'parsing', 'message': 'Creating new nodes...'})}\n\n"
+        yield _SSE_PARSING
         await asyncio.sleep(0.3)
 
-        created_nodes = []
-        for concept in mock_concepts:
-            new_node_data = NodeCreate(content=concept["content"], node_type="generated")
-            new_node = graph_service.create_node(
-                collection, new_node_data, knowledge_base_id
-            )
-            created_nodes.append(new_node)
-
-            edge_data = EdgeCreate(
-                source_id=source_node.id,
-                target_id=new_node.id,
-                relation_type=concept["relation"],
-                weight=random.randint(3, 5),
-            )
-            graph_service.create_edge(edge_data, knowledge_base_id)
-
-            yield f"data: {json.dumps({'type': 'node_created', 'node': {'id': new_node.id, 'content': new_node.content, 'node_type': new_node.node_type}, 'relation': concept['relation']})}\n\n"
+        created_nodes = await self._persist_concepts(
+            collection, source_node, knowledge_base_id, mock_concepts
+        )
+        for new_node, relation in created_nodes:
+            yield _node_created_event(new_node, relation)
             await asyncio.sleep(0.2)
 
-        yield f"data: {json.dumps({'type': 'complete', 'total_nodes': len(created_nodes)})}\n\n"
+        yield _sse({'type': 'complete', 'total_nodes': len(created_nodes)})
 
     def expand_node(
         self,
@@ -282,25 +669,20 @@ Only respond with valid JSON, no additional text."""
             f"Implication of {source_node.content}",
         ]
 
-        created_nodes = []
-        for concept in new_concepts:
-            # Create new node
-            new_node_data = NodeCreate(content=concept, node_type="generated")
-            new_node = graph_service.create_node(
-                collection, new_node_data, knowledge_base_id
-            )
-            created_nodes.append(new_node)
-
-            # Create edge
-            edge_data = EdgeCreate(
-                source_id=source_node.id,
-                target_id=new_node.id,
-                relation_type="suggested_by_ai",
-                weight=random.randint(1, 5),
-            )
-            graph_service.create_edge(edge_data, knowledge_base_id)
-
-        return created_nodes
+        created = graph_service.create_linked_nodes(
+            collection,
+            source_node.id,
+            [
+                (
+                    NodeCreate(content=concept, node_type="generated"),
+                    "suggested_by_ai",
+                    _edge_weight(source_node.id, concept, low=1),
+                )
+                for concept in new_concepts
+            ],
+            knowledge_base_id,
+        )
+        return [new_node for new_node, _ in created]
 
 
 ai_service = AIService()
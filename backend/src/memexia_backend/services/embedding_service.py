@@ -1,13 +1,74 @@
-from sentence_transformers import SentenceTransformer
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from memexia_backend.config import settings
+from memexia_backend.logger import logger
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+def _load_model() -> "SentenceTransformer":
+    """Load the embedding model on the configured backend."""
+    # Imported here so importing this module doesn't pull in torch
+    from sentence_transformers import SentenceTransformer
+
+    if settings.EMBEDDING_BACKEND == "onnx":
+        try:
+            return SentenceTransformer(
+                settings.EMBEDDING_MODEL,
+                backend="onnx",
+                model_kwargs={
+                    "file_name": settings.EMBEDDING_ONNX_FILE,
+                    "provider": "CPUExecutionProvider",
+                },
+            )
+        except ImportError:
+            logger.warning(
+                "ONNX Runtime not installed (install the `onnx` extra), "
+                "falling back to the torch embedding backend"
+            )
+        except Exception as e:
+            logger.warning(
+                f"Could not load ONNX embedding model {settings.EMBEDDING_ONNX_FILE} ({e}), "
+                "falling back to the torch embedding backend"
+            )
+
+    return SentenceTransformer(settings.EMBEDDING_MODEL)
+
 
 class EmbeddingService:
     def __init__(self):
-        # Load model lazily or on startup
-        self.model = SentenceTransformer(settings.EMBEDDING_MODEL)
+        # Loaded on first use, or up front by preload() during startup
+        self._model = None
+        self._lock = threading.Lock()
+        # Repeated texts (e.g. the same node re-expanded) skip the model
+        self._encode_one = lru_cache(maxsize=4096)(self._encode_uncached)
+
+    @property
+    def model(self) -> "SentenceTransformer":
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._model = _load_model()
+        return self._model
+
+    def preload(self) -> None:
+        """Load the model now rather than on the first request."""
+        self.model
+
+    def _encode_uncached(self, text: str) -> tuple[float, ...]:
+        return tuple(self.model.encode(text).tolist())
 
     def generate_embedding(self, text: str):
-        return self.model.encode(text).tolist()
+        return list(self._encode_one(text))
+
+    def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Encode several texts in one batched forward pass."""
+        if not texts:
+            return []
+        return self.model.encode(texts, batch_size=32, convert_to_numpy=True).tolist()
 
 # Singleton instance
 embedding_service = EmbeddingService()
@@ -13,6 +13,7 @@ Usage:
         node = db.create_node(session, node_data, "my-kb-id")
 """
 
+import threading
 from typing import Optional
 from enum import Enum
 
@@ -21,6 +22,7 @@ from .base import GraphDatabaseBackend
 
 # Lazy imports for optional backends
 _graph_db: Optional[GraphDatabaseBackend] = None
+_graph_db_lock = threading.Lock()
 
 
 class GraphDBType(str, Enum):
@@ -41,31 +43,36 @@ def get_graph_db() -> GraphDatabaseBackend:
     if _graph_db is not None:
         return _graph_db
 
-    db_type = getattr(settings, 'GRAPH_DB_TYPE', 'kuzu').lower()
+    with _graph_db_lock:
+        # Re-check: another thread may have created the backend meanwhile
+        if _graph_db is not None:
+            return _graph_db
 
-    if db_type == GraphDBType.NEBULA.value:
-        from .nebula_backend import NebulaGraphDatabase
+        db_type = getattr(settings, 'GRAPH_DB_TYPE', 'kuzu').lower()
 
-        host = getattr(settings, 'NEBULA_HOST', '127.0.0.1')
-        port = getattr(settings, 'NEBULA_PORT', 9669)
-        user = getattr(settings, 'NEBULA_USER', 'root')
-        password = getattr(settings, 'NEBULA_PASSWORD', 'nebula')
+        backend: GraphDatabaseBackend
+        if db_type == GraphDBType.NEBULA.value:
+            from .nebula_backend import NebulaGraphDatabase
 
-        _graph_db = NebulaGraphDatabase(
-            host=host,
-            port=port,
-            user=user,
-            password=password,
-        )
-    else:
-        # Default to Kuzu
-        from .kuzu_backend import KuzuGraphDatabase
+            # Host and port are already resolved from NEBULA_URI by Settings
+            backend = NebulaGraphDatabase(
+                host=settings.NEBULA_HOST,
+                port=settings.NEBULA_PORT,
+                user=settings.NEBULA_USER,
+                password=settings.NEBULA_PASSWORD,
+                pool_size=settings.DB_POOL_SIZE,
+            )
+        else:
+            # Default to Kuzu
+            from .kuzu_backend import KuzuGraphDatabase
 
-        _graph_db = KuzuGraphDatabase(
-            base_path=getattr(settings, 'KUZU_DB_PATH', './data/kuzu_db')
-        )
+            backend = KuzuGraphDatabase(
+                base_path=getattr(settings, 'KUZU_DB_PATH', './data/kuzu_db')
+            )
+
+        backend.initialize()
+        _graph_db = backend
 
-    _graph_db.initialize()
     return _graph_db
 
 
@@ -68,6 +68,28 @@ class GraphDatabaseBackend(ABC):
         """
         pass
 
+    def create_nodes(
+        self,
+        session: Any,
+        nodes: list[NodeCreate],
+        knowledge_base_id: str,
+    ) -> list[Node]:
+        """
+        Create several nodes.
+
+        Backends should override this with a single statement; the default
+        falls back to one create per node.
+
+        Args:
+            session: Database session
+            nodes: Node creation data
+            knowledge_base_id: Knowledge base ID
+
+        Returns:
+            Created Nodes, in input order
+        """
+        return [self.create_node(session, node, knowledge_base_id) for node in nodes]
+
     @abstractmethod
     def get_node(
         self,
@@ -86,6 +108,31 @@ class GraphDatabaseBackend(ABC):
         """
         pass
 
+    def get_nodes(
+        self,
+        session: Any,
+        node_ids: list[str],
+    ) -> list[Node]:
+        """
+        Get several nodes by ID.
+
+        Backends should override this with a single query; the default
+        falls back to one lookup per ID.
+
+        Args:
+            session: Database session
+            node_ids: Node IDs
+
+        Returns:
+            Nodes that were found (missing IDs are skipped)
+        """
+        nodes = []
+        for node_id in node_ids:
+            node = self.get_node(session, node_id)
+            if node is not None:
+                nodes.append(node)
+        return nodes
+
     @abstractmethod
     def update_node(
         self,
@@ -142,6 +189,31 @@ class GraphDatabaseBackend(ABC):
         """
         pass
 
+    def create_edges(
+        self,
+        session: Any,
+        edges: list[EdgeCreate],
+    ) -> list[Edge]:
+        """
+        Create several edges.
+
+        Backends should override this with a single statement; the default
+        falls back to one create per edge.
+
+        Args:
+            session: Database session
+            edges: Edge creation data
+
+        Returns:
+            Created Edges (edges whose endpoints are missing are skipped)
+        """
+        created = []
+        for edge in edges:
+            result = self.create_edge(session, edge)
+            if result is not None:
+                created.append(result)
+        return created
+
     @abstractmethod
     def get_graph_data(
         self,
@@ -9,10 +9,12 @@ import uuid
 import re
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Any
 from contextlib import contextmanager
 
 import kuzu
+from pydantic import TypeAdapter
 
 from memexia_backend.config import settings
 from memexia_backend.schemas import (
@@ -27,6 +29,111 @@ from .base import GraphDatabaseBackend
 from memexia_backend.logger import logger
 
 
+_UNSAFE_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
+# Fixed-shape queries, run by name through _execute
+_QUERIES = {
+    "create_node": """
+        CREATE (n:Node {
+            id: $id,
+            content: $content,
+            node_type: $node_type,
+            created_at: $created_at,
+            updated_at: $updated_at
+        })
+    """,
+    "create_nodes": """
+        UNWIND $rows AS row
+        CREATE (n:Node {
+            id: row.id,
+            content: row.content,
+            node_type: row.node_type,
+            created_at: $now,
+            updated_at: $now
+        })
+    """,
+    "get_node": """
+        MATCH (n:Node {id: $id})
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "get_nodes": """
+        MATCH (n:Node)
+        WHERE n.id IN $ids
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "update_node_content": """
+        MATCH (n:Node {id: $id})
+        SET n.updated_at = $updated_at, n.content = $content
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "update_node_type": """
+        MATCH (n:Node {id: $id})
+        SET n.updated_at = $updated_at, n.node_type = $node_type
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "update_node_both": """
+        MATCH (n:Node {id: $id})
+        SET n.updated_at = $updated_at, n.content = $content, n.node_type = $node_type
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "touch_node": """
+        MATCH (n:Node {id: $id})
+        SET n.updated_at = $updated_at
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "delete_node": """
+        MATCH (n:Node {id: $id})
+        DETACH DELETE n
+        RETURN n.id
+    """,
+    "create_edges": """
+        UNWIND $rows AS row
+        MATCH (a:Node {id: row.source_id}), (b:Node {id: row.target_id})
+        CREATE (a)-[r:RELATED {relation_type: row.relation_type, weight: row.weight}]->(b)
+        RETURN row.source_id, row.target_id, row.relation_type, row.weight
+    """,
+    "all_nodes": """
+        MATCH (n:Node)
+        RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
+    """,
+    "all_edges": """
+        MATCH (a:Node)-[r:RELATED]->(b:Node)
+        RETURN a.id, b.id, r.relation_type, r.weight
+    """,
+    "count_nodes": "MATCH (n:Node) RETURN count(n)",
+    "delete_all_edges": "MATCH ()-[r:RELATED]->() DELETE r",
+    "delete_all_nodes": "MATCH (n:Node) DELETE n",
+}
+
+_NODE_LIST_ADAPTER = TypeAdapter(list[Node])
+
+# SET variant per (content given, node_type given)
+_UPDATE_QUERY_NAMES = {
+    (True, True): "update_node_both",
+    (True, False): "update_node_content",
+    (False, True): "update_node_type",
+    (False, False): "touch_node",
+}
+
+
+def _node_from_row(row: list[Any]) -> Node:
+    """Build a Node from an (id, content, node_type, created_at, updated_at) row."""
+    return Node(
+        id=row[0],
+        content=row[1],
+        node_type=row[2],
+        created_at=row[3],
+        updated_at=row[4],
+    )
+
+
+@lru_cache(maxsize=1024)
+def _kb_id_to_db_name(knowledge_base_id: str) -> str:
+    """Convert KB ID to safe directory name."""
+    return f"kb_{_UNSAFE_NAME_CHARS.sub('_', knowledge_base_id)}"
+
+
 class KuzuGraphDatabase(GraphDatabaseBackend):
     """
     Kuzu embedded graph database backend.
@@ -63,10 +170,18 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
         self._databases.clear()
         logger.info("Kuzu connections closed")
 
+    def _execute(
+        self,
+        session: kuzu.Connection,
+        name: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> kuzu.QueryResult:
+        """Run a query from _QUERIES."""
+        return session.execute(_QUERIES[name], params or {})
+
     def _kb_id_to_db_name(self, knowledge_base_id: str) -> str:
         """Convert KB ID to safe directory name."""
-        safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', knowledge_base_id)
-        return f"kb_{safe_name}"
+        return _kb_id_to_db_name(knowledge_base_id)
 
     def _get_or_create_db(self, knowledge_base_id: str) -> tuple[kuzu.Database, kuzu.Connection]:
         """Get or create database and connection for a knowledge base."""
@@ -76,8 +191,9 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
             db_path = self.base_path / db_name
             db_path.mkdir(parents=True, exist_ok=True)
 
-            # Create database
-            db = kuzu.Database(str(db_path))
+            # Kuzu 0.11+ stores a database as a single file (plus WAL), so it
+            # lives inside the KB's directory and is removed along with it
+            db = kuzu.Database(str(db_path / "graph.kuzu"))
             conn = kuzu.Connection(db)
 
             # Initialize schema
@@ -140,19 +256,10 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
     ) -> Node:
         """Create a new node."""
         node_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
-
-        query = """
-            CREATE (n:Node {
-                id: $id,
-                content: $content,
-                node_type: $node_type,
-                created_at: $created_at,
-                updated_at: $updated_at
-            })
-        """
+        now_dt = datetime.now()
+        now = now_dt.isoformat()
 
-        session.execute(query, {
+        self._execute(session, "create_node", {
             "id": node_id,
             "content": node.content,
             "node_type": node.node_type,
@@ -166,49 +273,69 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
             id=node_id,
             content=node.content,
             node_type=node.node_type,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
+            created_at=now_dt,
+            updated_at=now_dt,
         )
 
+    def create_nodes(
+        self,
+        session: kuzu.Connection,
+        nodes: list[NodeCreate],
+        knowledge_base_id: str,
+    ) -> list[Node]:
+        """Create several nodes in a single statement."""
+        if not nodes:
+            return []
+
+        created_at = datetime.now()
+        now = created_at.isoformat()
+        rows = [
+            {"id": str(uuid.uuid4()), "content": node.content, "node_type": node.node_type}
+            for node in nodes
+        ]
+
+        self._execute(session, "create_nodes", {"rows": rows, "now": now})
+
+        logger.info(f"Created {len(rows)} nodes in KB {knowledge_base_id}")
+
+        return [
+            Node(
+                id=row["id"],
+                content=row["content"],
+                node_type=row["node_type"],
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for row in rows
+        ]
+
     def get_node(
         self,
         session: kuzu.Connection,
         node_id: str,
     ) -> Optional[Node]:
         """Get a node by ID."""
-        query = """
-            MATCH (n:Node {id: $id})
-            RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
-        """
+        # Single-statement executes always return one QueryResult
+        result = self._execute(session, "get_node", {"id": node_id})
 
-        result = session.execute(query, {"id": node_id})
-
-        # Support both driver Result objects and lists/tuples of rows
-        row = None
-        if isinstance(result, kuzu.QueryResult) and hasattr(result, "has_next"):
-            if result.has_next():
-                row = result.get_next()
-        elif isinstance(result, (list, tuple)) and len(result) > 0:
-            first = result[0]
-            if hasattr(first, "has_next"):
-                if first.has_next():
-                    row = first.get_next()
-        
-        if not row:
+        if not result.has_next():
             logger.warning(f"Node {node_id} not found")
             return None
 
+        return _node_from_row(result.get_next())
 
-        if row is not None:
-            return Node(
-                id=row[0],
-                content=row[1],
-                node_type=row[2],
-                created_at=row[3],
-                updated_at=row[4],
-            )
+    def get_nodes(
+        self,
+        session: kuzu.Connection,
+        node_ids: list[str],
+    ) -> list[Node]:
+        """Get several nodes by ID in a single query."""
+        if not node_ids:
+            return []
 
-        return None
+        result = self._execute(session, "get_nodes", {"ids": list(node_ids)})
+
+        return [_node_from_row(row) for row in result.get_all()]
 
     def update_node(
         self,
@@ -216,58 +343,36 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
         node_id: str,
         node: NodeUpdate,
     ) -> Optional[Node]:
-        """Update a node."""
-        # Check if exists
-        existing = self.get_node(session, node_id)
-        if existing is None:
-            return None
-
+        """Update a node, returning the new row in the same query."""
         now = datetime.now().isoformat()
 
-        # Build SET clause dynamically
-        set_parts = ["n.updated_at = $updated_at"]
         params = {"id": node_id, "updated_at": now}
 
         if node.content is not None:
-            set_parts.append("n.content = $content")
             params["content"] = node.content
 
         if node.node_type is not None:
-            set_parts.append("n.node_type = $node_type")
             params["node_type"] = node.node_type
 
-        set_clause = ", ".join(set_parts)
-        query = f"""
-            MATCH (n:Node {{id: $id}})
-            SET {set_clause}
-        """
+        query_name = _UPDATE_QUERY_NAMES[(node.content is not None, node.node_type is not None)]
+        result = self._execute(session, query_name, params)
 
-        session.execute(query, params)
+        # No row back means no node matched
+        if not result.has_next():
+            return None
 
-        return self.get_node(session, node_id)
+        return _node_from_row(result.get_next())
 
     def delete_node(
         self,
         session: kuzu.Connection,
         node_id: str,
     ) -> bool:
-        """Delete a node and its edges."""
-        # Check if exists
-        existing = self.get_node(session, node_id)
-        if existing is None:
+        """Delete a node and its edges in one query."""
+        result = self._execute(session, "delete_node", {"id": node_id})
+        if not result.has_next():
             return False
 
-        # Delete edges first, then node
-        session.execute("""
-            MATCH (n:Node {id: $id})-[r]-()
-            DELETE r
-        """, {"id": node_id})
-
-        session.execute("""
-            MATCH (n:Node {id: $id})
-            DELETE n
-        """, {"id": node_id})
-
         logger.info(f"Deleted node {node_id}")
         return True
 
@@ -277,116 +382,81 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
         edge: EdgeCreate,
     ) -> Optional[Edge]:
         """Create an edge between nodes."""
-        # Verify both nodes exist
-        source = self.get_node(session, edge.source_id)
-        target = self.get_node(session, edge.target_id)
-
-        if source is None or target is None:
-            logger.warning("Cannot create edge: source or target not found")
-            return None
+        # The MATCH in create_edges doubles as the endpoint existence check
+        created = self.create_edges(session, [edge])
+        return created[0] if created else None
 
-        weight = edge.weight if edge.weight is not None else 0
-
-        query = """
-            MATCH (a:Node {id: $source_id}), (b:Node {id: $target_id})
-            CREATE (a)-[r:RELATED {relation_type: $relation_type, weight: $weight}]->(b)
-        """
-
-        session.execute(query, {
-            "source_id": edge.source_id,
-            "target_id": edge.target_id,
-            "relation_type": edge.relation_type,
-            "weight": weight,
-        })
+    def create_edges(
+        self,
+        session: kuzu.Connection,
+        edges: list[EdgeCreate],
+    ) -> list[Edge]:
+        """Create several edges in a single statement."""
+        if not edges:
+            return []
+
+        rows = [
+            {
+                "source_id": edge.source_id,
+                "target_id": edge.target_id,
+                "relation_type": edge.relation_type,
+                "weight": edge.weight if edge.weight is not None else 0,
+            }
+            for edge in edges
+        ]
+
+        # MATCH drops rows whose endpoints are missing; RETURN reports the rest
+        result = self._execute(session, "create_edges", {"rows": rows})
+
+        created = []
+        while result.has_next():
+            source_id, target_id, relation_type, weight = result.get_next()
+            created.append(Edge(
+                source_id=source_id,
+                target_id=target_id,
+                relation_type=relation_type,
+                weight=weight,
+            ))
 
-        return Edge(
-            id=f"{edge.source_id}->{edge.target_id}",
-            source_id=edge.source_id,
-            target_id=edge.target_id,
-            relation_type=edge.relation_type,
-            weight=weight,
-        )
+        if len(created) < len(rows):
+            logger.warning(
+                f"Skipped {len(rows) - len(created)} edge(s): source or target not found"
+            )
+        return created
 
     def get_graph_data(
         self,
         session: kuzu.Connection,
     ) -> GraphData:
         """Get all nodes and edges."""
-        # Get all nodes
-        nodes_result = session.execute("""
-            MATCH (n:Node)
-            RETURN n.id, n.content, n.node_type, n.created_at, n.updated_at
-        """)
-
-        nodes = []
-
-        def _iter_result(res):
-            # Yield rows from either Result-like objects or lists/tuples
-            if isinstance(res, kuzu.QueryResult) and hasattr(res, "has_next"):
-                while res.has_next():
-                    yield res.get_next()
-            elif isinstance(res, (list, tuple)):
-                for item in res:
-                    if hasattr(item, "has_next"):
-                        while item.has_next():
-                            yield item.get_next()
-                    else:
-                        yield item
-
-        def _normalize_row(row):
-            # Normalize row to a list of values so numeric indexing is safe
-            if row is None:
-                return []
-            if isinstance(row, dict):
-                return list(row.values())
-            try:
-                if isinstance(row, (list, tuple)):
-                    return list(row)
-                # Some driver row types are iterable
-                return list(row)
-            except Exception:
-                return [row]
-
-        for row in _iter_result(nodes_result):
-            vals = _normalize_row(row)
-            nodes.append(Node(
-                id=vals[0] if len(vals) > 0 else None,
-                content=vals[1] if len(vals) > 1 else None,
-                node_type=vals[2] if len(vals) > 2 else None,
-                created_at=vals[3] if len(vals) > 3 else None,
-                updated_at=vals[4] if len(vals) > 4 else None,
-            ))
-
-        # Get all edges
-        edges_result = session.execute("""
-            MATCH (a:Node)-[r:RELATED]->(b:Node)
-            RETURN a.id, b.id, r.relation_type, r.weight
-        """)
-
-        edges = []
-
-        def _iter_result(res):
-            # Yield rows from either Result-like objects or lists/tuples
-            if hasattr(res, "has_next"):
-                while res.has_next():
-                    yield res.get_next()
-            elif isinstance(res, (list, tuple)):
-                for item in res:
-                    if hasattr(item, "has_next"):
-                        while item.has_next():
-                            yield item.get_next()
-                    else:
-                        yield item
-
-        for row in _iter_result(edges_result):
-            vals = _normalize_row(row)
-            edges.append(Edge(
-                id=f"{vals[0]}->{vals[1]}" if len(vals) > 1 else "",
-                source_id=vals[0] if len(vals) > 0 else None,
-                target_id=vals[1] if len(vals) > 1 else None,
-                relation_type=vals[2] if len(vals) > 2 else None,
-                weight=(vals[3] or 0) if len(vals) > 3 else 0,
-            ))
+        # Fetch each result in one call rather than a has_next()/get_next()
+        # round trip per row
+        node_rows = self._execute(session, "all_nodes").get_all()
+        edge_rows = self._execute(session, "all_edges").get_all()
+
+        # One validation pass over the whole list (timestamps are stored as
+        # ISO strings and still need parsing)
+        nodes = _NODE_LIST_ADAPTER.validate_python([
+            {
+                "id": row[0],
+                "content": row[1],
+                "node_type": row[2],
+                "created_at": row[3],
+                "updated_at": row[4],
+            }
+            for row in node_rows
+        ])
+
+        # Edge columns already have the schema's types; skip validation
+        edges = [
+            Edge.model_construct(
+                source_id=source_id,
+                target_id=target_id,
+                relation_type=relation_type,
+                weight=weight or 0,
+            )
+            for source_id, target_id, relation_type, weight in edge_rows
+        ]
 
         return GraphData(nodes=nodes, edges=edges)
 
@@ -396,52 +466,14 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
     ) -> int:
         """Delete all nodes and edges."""
         # Count nodes first
-        count_result = session.execute("MATCH (n:Node) RETURN count(n)")
-        count = 0
-
-        def _get_first_from_row(row: Any) -> int:
-            # Handle None
-            if row is None:
-                return 0
-            # If row is a plain tuple/list
-            if isinstance(row, (list, tuple)):
-                return int(row[0]) if len(row) > 0 else 0
-            # If row is a mapping/dict-like
-            if isinstance(row, dict):
-                vals = list(row.values())
-                return int(vals[0]) if vals else 0
-            # If row is a driver result/row object that exposes get_next()
-            if hasattr(row, "get_next"):
-                try:
-                    next_row = row.get_next()
-                except Exception:
-                    return 0
-                return _get_first_from_row(next_row)
-            # Fallback: try indexing or casting
-            try:
-                return int(row[0])
-            except Exception:
-                try:
-                    return int(row)
-                except Exception:
-                    return 0
-
-        if isinstance(count_result, kuzu.QueryResult) and hasattr(count_result, "has_next"):
-            if count_result.has_next():
-                count = _get_first_from_row(count_result.get_next())
-        elif isinstance(count_result, (list, tuple)) and len(count_result) > 0:
-            first = count_result[0]
-            if isinstance(first, kuzu.QueryResult) and hasattr(first, "has_next"):
-                if first.has_next():
-                    count = _get_first_from_row(first.get_next())
-            else:
-                count = _get_first_from_row(first)
+        count_result = self._execute(session, "count_nodes")
+        count = count_result.get_next()[0] if count_result.has_next() else 0
 
         # Delete all edges
-        session.execute("MATCH ()-[r:RELATED]->() DELETE r")
+        self._execute(session, "delete_all_edges")
 
         # Delete all nodes
-        session.execute("MATCH (n:Node) DELETE n")
+        self._execute(session, "delete_all_nodes")
 
         logger.info(f"Deleted {count} nodes")
         return count
@@ -458,11 +490,11 @@ class KuzuGraphDatabase(GraphDatabaseBackend):
 
         # Close connection if open
         if db_name in self._connections:
+            conn = self._connections.pop(db_name)
             try:
-                self._connections[db_name].close()
+                conn.close()
             except Exception:
                 pass
-            del self._connections[db_name]
 
         if db_name in self._databases:
             del self._databases[db_name]
@@ -7,8 +7,11 @@ Each knowledge base gets its own Space for isolation.
 
 import uuid
 import re
+import threading
 import time
-from typing import Optional, Any, Dict, List
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Optional, Any, Callable, Dict, Iterator, List
 from contextlib import contextmanager
 
 # from memexia_backend.config import settings
@@ -27,6 +30,7 @@ from memexia_backend.logger import logger
 try:
     from nebula3.gclient.net import ConnectionPool
     from nebula3.Config import Config as NebulaConfig
+    from nebula3.common.ttypes import Value as NebulaValue
     # from nebula3.gclient.net.Session import Session as NebulaSession
     # from nebula3.data.ResultSet import ResultSet
     NEBULA_AVAILABLE = True
@@ -35,6 +39,18 @@ except ImportError:
     logger.warning("nebula3-python not installed, NebulaGraph backend unavailable")
 
 
+_UNSAFE_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+# Rows per multi-value INSERT, keeping large ingests under statement size limits
+_INSERT_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=1024)
+def _kb_id_to_space_name(knowledge_base_id: str) -> str:
+    """Convert KB ID to valid space name."""
+    return f"kb_{_UNSAFE_NAME_CHARS.sub('_', knowledge_base_id)}"
+
+
 def _escape_string(s: str) -> str:
     """Escape string for nGQL query."""
     if s is None:
@@ -42,37 +58,177 @@ def _escape_string(s: str) -> str:
     return s.replace("\\", "\\\\").replace('"', '\\"').replace("'", "\\'")
 
 
-def _parse_result_to_dict(result) -> List[Dict[str, Any]]:
-    """Parse NebulaGraph result set to list of dictionaries."""
+def _params(**values: Any) -> Dict[str, Any]:
+    """Wrap str/int query parameters as Nebula values for execute_parameter."""
+    return {
+        name: NebulaValue(iVal=value) if isinstance(value, int) else NebulaValue(sVal=value.encode())
+        for name, value in values.items()
+    }
+
+
+def _value_converter(value: Any) -> Callable[[Any], Any]:
+    """Pick the ValueWrapper accessor matching a (non-null) value's type."""
+    if value.is_string():
+        return lambda v: v.as_string()
+    if value.is_int():
+        return lambda v: v.as_int()
+    if value.is_double():
+        return lambda v: v.as_double()
+    if value.is_bool():
+        return lambda v: v.as_bool()
+    return str
+
+
+def _iter_result_rows(result) -> Iterator[Dict[str, Any]]:
+    """Yield NebulaGraph result rows as dictionaries."""
     if not result.is_succeeded():
         logger.error(f"Query failed: {result.error_msg()}")
-        return []
+        return
 
-    rows = []
     if result.is_empty():
-        return rows
+        return
 
     col_names = result.keys()
+    # Columns hold a single type, so resolve each converter once
+    converters: list[Optional[Callable[[Any], Any]]] = [None] * len(col_names)
 
     for row_idx in range(result.row_size()):
         row_data = {}
-        for col_idx, col_name in enumerate(col_names):
-            value = result.row_values(row_idx)[col_idx]
+        for col_idx, value in enumerate(result.row_values(row_idx)):
             if value.is_null():
-                row_data[col_name] = None
-            elif value.is_string():
-                row_data[col_name] = value.as_string()
-            elif value.is_int():
-                row_data[col_name] = value.as_int()
-            elif value.is_double():
-                row_data[col_name] = value.as_double()
-            elif value.is_bool():
-                row_data[col_name] = value.as_bool()
+                row_data[col_names[col_idx]] = None
+                continue
+
+            convert = converters[col_idx]
+            if convert is None:
+                convert = converters[col_idx] = _value_converter(value)
+            row_data[col_names[col_idx]] = convert(value)
+        yield row_data
+
+
+def _parse_result_to_dict(result) -> List[Dict[str, Any]]:
+    """Parse NebulaGraph result set to list of dictionaries."""
+    return list(_iter_result_rows(result))
+
+
+def _show_names(session: Any, stmt: str) -> set[str]:
+    """Run a SHOW statement and collect its `Name` column."""
+    return {row["Name"] for row in _parse_result_to_dict(session.execute(stmt))}
+
+
+def _wait_until(
+    predicate: Callable[[], bool],
+    attempts: int = 100,
+    interval: float = 0.05,
+) -> bool:
+    """Poll a predicate until it holds or the attempts are exhausted."""
+    for _ in range(attempts):
+        if predicate():
+            return True
+        time.sleep(interval)
+    return False
+
+
+class _SpaceBoundSession:
+    """
+    Session wrapper that switches to a space lazily.
+
+    The `USE` statement is sent together with the first query in a single
+    multi-statement execute instead of as a separate round trip.
+    """
+
+    def __init__(self, session: Any, space_name: str):
+        self._session = session
+        self.switch_space(space_name)
+
+    def switch_space(self, space_name: str) -> None:
+        """Point the session at another space from the next query on."""
+        self._use_stmt: Optional[str] = f"USE `{space_name}`;"
+
+    def execute(self, stmt: str):
+        return self.execute_parameter(stmt, None)
+
+    def execute_parameter(self, stmt: str, params: Optional[Dict[str, Any]]):
+        if self._use_stmt is None:
+            return self._session.execute_parameter(stmt, params)
+
+        result = self._session.execute_parameter(f"{self._use_stmt} {stmt}", params)
+        if result.is_succeeded():
+            self._use_stmt = None
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
+class _KbSessionPool:
+    """
+    Idle sessions kept per space, so reused sessions skip `USE` entirely.
+
+    When a space has no idle session, one idle for another space is switched
+    over instead, trading an authentication round trip for a prefixed `USE`.
+
+    Each idle session pins a pooled connection, so the total number kept is
+    bounded and the least recently used space gives up its sessions first.
+    """
+
+    def __init__(self, max_idle: int):
+        self._max_idle = max_idle
+        self._idle: OrderedDict[str, deque[_SpaceBoundSession]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, space_name: str) -> Optional[_SpaceBoundSession]:
+        """Take an idle session for the space (or any space), if one is available."""
+        with self._lock:
+            idle = self._idle.get(space_name)
+            if idle:
+                self._size -= 1
+                return idle.pop()
+
+            if not self._idle:
+                return None
+
+            # Borrow from the least recently used space
+            oldest_space, oldest = next(iter(self._idle.items()))
+            session = oldest.popleft()
+            self._size -= 1
+            if not oldest:
+                del self._idle[oldest_space]
+
+        session.switch_space(space_name)
+        return session
+
+    def put(self, space_name: str, session: _SpaceBoundSession) -> None:
+        """Return a session for reuse, releasing whatever no longer fits."""
+        evicted: list[_SpaceBoundSession] = []
+        with self._lock:
+            self._idle.setdefault(space_name, deque()).append(session)
+            self._idle.move_to_end(space_name)
+            self._size += 1
+
+            while self._size > self._max_idle:
+                oldest_space, oldest = next(iter(self._idle.items()))
+                evicted.append(oldest.popleft())
+                self._size -= 1
+                if not oldest:
+                    del self._idle[oldest_space]
+
+        for stale in evicted:
+            stale.release()
+
+    def drain(self, space_name: Optional[str] = None) -> None:
+        """Release idle sessions for one space, or for all spaces."""
+        with self._lock:
+            if space_name is None:
+                drained = [s for idle in self._idle.values() for s in idle]
+                self._idle.clear()
             else:
-                row_data[col_name] = str(value)
-        rows.append(row_data)
+                drained = list(self._idle.pop(space_name, ()))
+            self._size -= len(drained)
 
-    return rows
+        for session in drained:
+            session.release()
 
 
 class NebulaGraphDatabase(GraphDatabaseBackend):
@@ -89,6 +245,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         port: int = 9669,
         user: str = "root",
         password: str = "nebula",
+        pool_size: int = 10,
     ):
         """
         Initialize NebulaGraph backend.
@@ -98,6 +255,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
             port: NebulaGraph port
             user: Username
             password: Password
+            pool_size: Maximum number of pooled connections
         """
         if not NEBULA_AVAILABLE:
             raise RuntimeError("nebula3-python is not installed")
@@ -106,29 +264,44 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         self.port = port
         self.user = user
         self.password = password
+        self.pool_size = pool_size
         self._pool: Optional[ConnectionPool] = None # type: ignore
+        self._pool_lock = threading.Lock()
         self._initialized_spaces: set[str] = set()
+        self._spaces_lock = threading.RLock()
+        self._kb_sessions = _KbSessionPool(max_idle=max(1, pool_size // 2))
 
     def initialize(self) -> None:
-        """Initialize the connection pool."""
+        """Initialize the connection pool and perform a warm-up handshake."""
         if self._pool is not None:
             return
 
-        config = NebulaConfig() # type: ignore
-        config.max_connection_pool_size = 10
-        config.timeout = 5000
+        with self._pool_lock:
+            # Another thread may have finished initialization while we waited
+            if self._pool is not None:
+                return
+
+            config = NebulaConfig() # type: ignore
+            config.max_connection_pool_size = self.pool_size
+            config.timeout = 5000
+
+            pool = ConnectionPool() # type: ignore
+            ok = pool.init([(self.host, self.port)], config)
+
+            if not ok:
+                raise RuntimeError("Failed to initialize NebulaGraph connection pool")
 
-        self._pool = ConnectionPool() # type: ignore
-        ok = self._pool.init([(self.host, self.port)], config)
+            # Authenticate once so the first request doesn't pay for the handshake
+            pool.get_session(self.user, self.password).release()
 
-        if not ok:
-            raise RuntimeError("Failed to initialize NebulaGraph connection pool")
+            self._pool = pool
 
         logger.info("NebulaGraph connection pool initialized")
 
     def close(self) -> None:
         """Close the connection pool."""
         if self._pool is not None:
+            self._kb_sessions.drain()
             self._pool.close()
             self._pool = None
             self._initialized_spaces.clear()
@@ -136,8 +309,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
 
     def _kb_id_to_space_name(self, knowledge_base_id: str) -> str:
         """Convert KB ID to valid space name."""
-        safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', knowledge_base_id)
-        return f"kb_{safe_name}"
+        return _kb_id_to_space_name(knowledge_base_id)
 
     def _ensure_space_exists(self, knowledge_base_id: str) -> None:
         """Ensure space exists for a knowledge base."""
@@ -145,49 +317,68 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
 
         if space_name in self._initialized_spaces:
             return
-        
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized")
-        
-        session = self._pool.get_session(self.user, self.password)
-
-        try:
-            # Create space
-            session.execute(f"""
-                CREATE SPACE IF NOT EXISTS `{space_name}` (
-                    partition_num=10,
-                    replica_factor=1,
-                    vid_type=FIXED_STRING(64)
-                );
-            """)
-
-            time.sleep(2)
-            session.execute(f"USE `{space_name}`;")
-
-            # Create schema
-            session.execute("""
-                CREATE TAG IF NOT EXISTS Node (
-                    content string,
-                    node_type string,
-                    created_at string,
-                    updated_at string
-                );
-            """)
-
-            session.execute("""
-                CREATE EDGE IF NOT EXISTS RELATED (
-                    relation_type string,
-                    weight int
-                );
-            """)
-
-            time.sleep(1)
-
-            self._initialized_spaces.add(space_name)
-            logger.info(f"NebulaGraph space '{space_name}' initialized")
 
-        finally:
-            session.release()
+        with self._spaces_lock:
+            # Another thread may have created the space while we waited
+            if space_name in self._initialized_spaces:
+                return
+
+            if self._pool is None:
+                raise RuntimeError("Connection pool not initialized")
+
+            session = self._pool.get_session(self.user, self.password)
+
+            try:
+                # Create space
+                result = session.execute(f"""
+                    CREATE SPACE IF NOT EXISTS `{space_name}` (
+                        partition_num=10,
+                        replica_factor=1,
+                        vid_type=FIXED_STRING(64)
+                    );
+                """)
+                if not result.is_succeeded():
+                    raise RuntimeError(
+                        f"Failed to create space '{space_name}': {result.error_msg()}"
+                    )
+
+                # DDL is applied asynchronously; poll instead of sleeping
+                if not _wait_until(lambda: space_name in _show_names(session, "SHOW SPACES;")):
+                    raise RuntimeError(f"Space '{space_name}' did not become ready")
+
+                # A listed space may not accept USE until storage catches up,
+                # so switch space and (idempotently) create the schema on every
+                # attempt until it succeeds and the schema is visible
+                schema_ddl = f"""
+                    USE `{space_name}`;
+                    CREATE TAG IF NOT EXISTS Node (
+                        content string,
+                        node_type string,
+                        created_at string,
+                        updated_at string
+                    );
+                    CREATE EDGE IF NOT EXISTS RELATED (
+                        relation_type string,
+                        weight int
+                    );
+                """
+
+                def schema_ready() -> bool:
+                    if not session.execute(schema_ddl).is_succeeded():
+                        return False
+                    return (
+                        "Node" in _show_names(session, "SHOW TAGS;")
+                        and "RELATED" in _show_names(session, "SHOW EDGES;")
+                    )
+
+                if not _wait_until(schema_ready):
+                    raise RuntimeError(f"Schema for space '{space_name}' did not become ready")
+
+                self._initialized_spaces.add(space_name)
+                logger.info(f"NebulaGraph space '{space_name}' initialized")
+
+            finally:
+                session.release()
 
     @contextmanager
     def session_for_kb(self, knowledge_base_id: str):
@@ -198,15 +389,21 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         self._ensure_space_exists(knowledge_base_id)
 
         space_name = self._kb_id_to_space_name(knowledge_base_id)
-        if self._pool is None:
-            raise RuntimeError("Connection pool not initialized")
-        session = self._pool.get_session(self.user, self.password)
+        session = self._kb_sessions.acquire(space_name)
+        if session is None:
+            if self._pool is None:
+                raise RuntimeError("Connection pool not initialized")
+            session = _SpaceBoundSession(
+                self._pool.get_session(self.user, self.password), space_name
+            )
 
         try:
-            session.execute(f"USE `{space_name}`;")
             yield session
-        finally:
+        except BaseException:
+            # The session may be in an unknown state; don't hand it out again
             session.release()
+            raise
+        self._kb_sessions.put(space_name, session)
 
     def create_node(
         self,
@@ -218,18 +415,19 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         from datetime import datetime
 
         node_id = str(uuid.uuid4())
-        now = datetime.now().isoformat()
-
-        content_escaped = _escape_string(node.content)
-        node_type_escaped = _escape_string(node.node_type)
-        now_escaped = _escape_string(now)
+        now_dt = datetime.now()
 
+        # Property values are bound server-side; the generated VID needs no escaping
         query = f'''
         INSERT VERTEX Node(content, node_type, created_at, updated_at)
-        VALUES "{node_id}":("{content_escaped}", "{node_type_escaped}", "{now_escaped}", "{now_escaped}");
+        VALUES "{node_id}":($content, $node_type, $now, $now);
         '''
 
-        result = session.execute(query)
+        result = session.execute_parameter(query, _params(
+            content=node.content,
+            node_type=node.node_type,
+            now=now_dt.isoformat(),
+        ))
         if not result.is_succeeded():
             raise RuntimeError(f"Failed to create node: {result.error_msg()}")
 
@@ -239,9 +437,74 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
             id=node_id,
             content=node.content,
             node_type=node.node_type,
-            created_at=datetime.fromisoformat(now),
-            updated_at=datetime.fromisoformat(now),
+            created_at=now_dt,
+            updated_at=now_dt,
+        )
+
+    def create_nodes(
+        self,
+        session: Any,
+        nodes: list[NodeCreate],
+        knowledge_base_id: str,
+    ) -> list[Node]:
+        """
+        Create several nodes with multi-value INSERTs.
+
+        Preferred over create_node for bulk ingest; rows are sent in
+        batches of _INSERT_BATCH_SIZE per statement, with property values
+        bound as per-row parameters ($c0, $t0, $c1, ...).
+        """
+        from datetime import datetime
+
+        if not nodes:
+            return []
+
+        created_at = datetime.now()
+        node_ids = [str(uuid.uuid4()) for _ in nodes]
+
+        for start in range(0, len(nodes), _INSERT_BATCH_SIZE):
+            batch = nodes[start:start + _INSERT_BATCH_SIZE]
+            values = ", ".join(
+                f'"{node_id}":($c{i}, $t{i}, $now, $now)'
+                for i, node_id in enumerate(node_ids[start:start + _INSERT_BATCH_SIZE])
+            )
+            params = {"now": created_at.isoformat()}
+            for i, node in enumerate(batch):
+                params[f"c{i}"] = node.content
+                params[f"t{i}"] = node.node_type
+
+            query = f'''
+            INSERT VERTEX Node(content, node_type, created_at, updated_at)
+            VALUES {values};
+            '''
+
+            result = session.execute_parameter(query, _params(**params))
+            if not result.is_succeeded():
+                raise RuntimeError(f"Failed to create nodes: {result.error_msg()}")
+
+        logger.info(f"Created {len(node_ids)} nodes")
+
+        return [
+            Node(
+                id=node_id,
+                content=node.content,
+                node_type=node.node_type,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for node_id, node in zip(node_ids, nodes)
+        ]
+
+    def _existing_node_ids(self, session: Any, node_ids: list[str]) -> set[str]:
+        """Return which of the given node IDs exist, fetching only the IDs."""
+        if not node_ids:
+            return set()
+
+        ids_str = ", ".join(f'"{_escape_string(node_id)}"' for node_id in node_ids)
+        rows = _parse_result_to_dict(
+            session.execute(f'FETCH PROP ON Node {ids_str} YIELD id(vertex) as vid;')
         )
+        return {row["vid"] for row in rows}
 
     def get_node(
         self,
@@ -275,6 +538,39 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
             updated_at=row.get("updated_at", ""),
         )
 
+    def get_nodes(
+        self,
+        session: Any,
+        node_ids: list[str],
+    ) -> list[Node]:
+        """Get several nodes by ID with a single FETCH."""
+        if not node_ids:
+            return []
+
+        ids_str = ", ".join(f'"{_escape_string(node_id)}"' for node_id in node_ids)
+
+        query = f'''
+        FETCH PROP ON Node {ids_str}
+        YIELD id(vertex) as vid,
+              properties(vertex).content as content,
+              properties(vertex).node_type as node_type,
+              properties(vertex).created_at as created_at,
+              properties(vertex).updated_at as updated_at;
+        '''
+
+        rows = _parse_result_to_dict(session.execute(query))
+
+        return [
+            Node(
+                id=row.get("vid", ""),
+                content=row.get("content", ""),
+                node_type=row.get("node_type", ""),
+                created_at=row.get("created_at", ""),
+                updated_at=row.get("updated_at", ""),
+            )
+            for row in rows
+        ]
+
     def update_node(
         self,
         session: Any,
@@ -284,21 +580,20 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         """Update a node."""
         from datetime import datetime
 
-        existing = self.get_node(session, node_id)
-        if existing is None:
+        if not self._existing_node_ids(session, [node_id]):
             return None
 
         node_id_escaped = _escape_string(node_id)
-        now = datetime.now().isoformat()
-        now_escaped = _escape_string(now)
-
-        set_clauses = [f'updated_at = "{now_escaped}"']
+        values = {"now": datetime.now().isoformat()}
+        set_clauses = ["updated_at = $now"]
 
         if node.content is not None:
-            set_clauses.append(f'content = "{_escape_string(node.content)}"')
+            values["content"] = node.content
+            set_clauses.append("content = $content")
 
         if node.node_type is not None:
-            set_clauses.append(f'node_type = "{_escape_string(node.node_type)}"')
+            values["node_type"] = node.node_type
+            set_clauses.append("node_type = $node_type")
 
         set_clause = ", ".join(set_clauses)
 
@@ -307,7 +602,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         SET {set_clause};
         '''
 
-        result = session.execute(query)
+        result = session.execute_parameter(query, _params(**values))
         if not result.is_succeeded():
             logger.error(f"Failed to update node: {result.error_msg()}")
             return None
@@ -320,8 +615,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         node_id: str,
     ) -> bool:
         """Delete a node and its edges."""
-        existing = self.get_node(session, node_id)
-        if existing is None:
+        if not self._existing_node_ids(session, [node_id]):
             return False
 
         node_id_escaped = _escape_string(node_id)
@@ -342,36 +636,95 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
         edge: EdgeCreate,
     ) -> Optional[Edge]:
         """Create an edge between nodes."""
-        source = self.get_node(session, edge.source_id)
-        target = self.get_node(session, edge.target_id)
+        existing_ids = self._existing_node_ids(session, [edge.source_id, edge.target_id])
 
-        if source is None or target is None:
+        if edge.source_id not in existing_ids or edge.target_id not in existing_ids:
             logger.warning("Cannot create edge: source or target not found")
             return None
 
         source_escaped = _escape_string(edge.source_id)
         target_escaped = _escape_string(edge.target_id)
-        relation_escaped = _escape_string(edge.relation_type)
         weight = edge.weight if edge.weight is not None else 0
 
         query = f'''
         INSERT EDGE RELATED(relation_type, weight)
-        VALUES "{source_escaped}"->"{target_escaped}":("{relation_escaped}", {weight});
+        VALUES "{source_escaped}"->"{target_escaped}":($relation_type, $weight);
         '''
 
-        result = session.execute(query)
+        result = session.execute_parameter(
+            query, _params(relation_type=edge.relation_type, weight=weight)
+        )
         if not result.is_succeeded():
             logger.error(f"Failed to create edge: {result.error_msg()}")
             return None
 
         return Edge(
-            id=f"{edge.source_id}->{edge.target_id}",
             source_id=edge.source_id,
             target_id=edge.target_id,
             relation_type=edge.relation_type,
             weight=weight,
         )
 
+    def create_edges(
+        self,
+        session: Any,
+        edges: list[EdgeCreate],
+    ) -> list[Edge]:
+        """
+        Create several edges with one existence check and multi-value INSERTs.
+
+        Preferred over create_edge for bulk ingest; rows are sent in
+        batches of _INSERT_BATCH_SIZE per statement, with property values
+        bound as per-row parameters ($r0, $w0, $r1, ...).
+        """
+        if not edges:
+            return []
+
+        endpoint_ids = {edge.source_id for edge in edges} | {edge.target_id for edge in edges}
+        existing_ids = self._existing_node_ids(session, list(endpoint_ids))
+
+        valid = [
+            edge for edge in edges
+            if edge.source_id in existing_ids and edge.target_id in existing_ids
+        ]
+        if len(valid) < len(edges):
+            logger.warning(
+                f"Skipped {len(edges) - len(valid)} edge(s): source or target not found"
+            )
+        if not valid:
+            return []
+
+        for start in range(0, len(valid), _INSERT_BATCH_SIZE):
+            batch = valid[start:start + _INSERT_BATCH_SIZE]
+            values = ", ".join(
+                f'"{_escape_string(edge.source_id)}"->"{_escape_string(edge.target_id)}":'
+                f'($r{i}, $w{i})'
+                for i, edge in enumerate(batch)
+            )
+            params = {}
+            for i, edge in enumerate(batch):
+                params[f"r{i}"] = edge.relation_type
+                params[f"w{i}"] = edge.weight if edge.weight is not None else 0
+
+            query = f'''
+            INSERT EDGE RELATED(relation_type, weight)
+            VALUES {values};
+            '''
+
+            result = session.execute_parameter(query, _params(**params))
+            if not result.is_succeeded():
+                raise RuntimeError(f"Failed to create edges: {result.error_msg()}")
+
+        return [
+            Edge(
+                source_id=edge.source_id,
+                target_id=edge.target_id,
+                relation_type=edge.relation_type,
+                weight=edge.weight if edge.weight is not None else 0,
+            )
+            for edge in valid
+        ]
+
     def get_graph_data(
         self,
         session: Any,
@@ -387,18 +740,16 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
                n.Node.updated_at as updated_at;
         '''
 
-        nodes_result = session.execute(nodes_query)
-        nodes_rows = _parse_result_to_dict(nodes_result)
-
-        nodes = []
-        for row in nodes_rows:
-            nodes.append(Node(
+        nodes = [
+            Node(
                 id=row.get("vid", ""),
                 content=row.get("content", ""),
                 node_type=row.get("node_type", ""),
                 created_at=row.get("created_at", ""),
                 updated_at=row.get("updated_at", ""),
-            ))
+            )
+            for row in _iter_result_rows(session.execute(nodes_query))
+        ]
 
         # Get edges
         edges_query = '''
@@ -409,18 +760,15 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
                r.weight as weight;
         '''
 
-        edges_result = session.execute(edges_query)
-        edges_rows = _parse_result_to_dict(edges_result)
-
-        edges = []
-        for row in edges_rows:
-            edges.append(Edge(
-                id=f"{row.get('source_id')}->{row.get('target_id')}",
+        edges = [
+            Edge(
                 source_id=row.get("source_id", ""),
                 target_id=row.get("target_id", ""),
                 relation_type=row.get("relation_type", ""),
                 weight=row.get("weight", 0),
-            ))
+            )
+            for row in _iter_result_rows(session.execute(edges_query))
+        ]
 
         return GraphData(nodes=nodes, edges=edges)
 
@@ -450,6 +798,7 @@ class NebulaGraphDatabase(GraphDatabaseBackend):
             return False
 
         space_name = self._kb_id_to_space_name(knowledge_base_id)
+        self._kb_sessions.drain(space_name)
         session = self._pool.get_session(self.user, self.password)
 
         try:
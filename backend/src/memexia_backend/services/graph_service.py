@@ -5,7 +5,11 @@ Uses pluggable graph database backend (Kuzu or NebulaGraph).
 Each knowledge base has its own database/space for data isolation.
 """
 
-from typing import Optional
+import asyncio
+import threading
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Iterator, Optional
 
 from chromadb.api.models.Collection import Collection
 
@@ -19,9 +23,89 @@ from memexia_backend.schemas import (
 )
 from memexia_backend.services.embedding_service import embedding_service
 from memexia_backend.services.graph import get_graph_db
+from memexia_backend.utils.cache import TTLCache
 from memexia_backend.logger import logger
 
 
+# Recently read nodes, keyed by (knowledge_base_id, node_id). Writes below
+# drop the affected entries; other workers see changes once the TTL lapses.
+_node_cache = TTLCache(maxsize=2048, ttl=30)
+
+
+class GraphSessionScope:
+    """
+    Graph sessions shared by every graph_service call within one scope.
+
+    Sessions are opened lazily on first use per knowledge base, so binding a
+    scope costs nothing until a graph call is actually made.
+    """
+
+    def __init__(self):
+        self._stack = ExitStack()
+        self._sessions: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def session(self, knowledge_base_id: str) -> Any:
+        """Get (or open) the scope's session for a knowledge base."""
+        with self._lock:
+            if knowledge_base_id not in self._sessions:
+                db = get_graph_db()
+                self._sessions[knowledge_base_id] = self._stack.enter_context(
+                    db.session_for_kb(knowledge_base_id)
+                )
+            return self._sessions[knowledge_base_id]
+
+    def close(self) -> None:
+        """Return all sessions opened in this scope."""
+        with self._lock:
+            self.closed = True
+            self._sessions.clear()
+            self._stack.close()
+
+
+_session_scope: ContextVar[Optional[GraphSessionScope]] = ContextVar(
+    "graph_session_scope", default=None
+)
+
+
+def bind_session_scope() -> GraphSessionScope:
+    """
+    Share graph sessions across graph_service calls in the current context.
+
+    The caller owns the returned scope and must close() it.
+    """
+    scope = GraphSessionScope()
+    _session_scope.set(scope)
+    return scope
+
+
+async def request_session_scope() -> AsyncIterator[None]:
+    """
+    FastAPI dependency sharing graph sessions for the whole request.
+
+    Declared async so the bound scope lives in the request's own context and
+    is inherited by the threadpool running sync handlers.
+    """
+    scope = bind_session_scope()
+    try:
+        yield
+    finally:
+        await asyncio.to_thread(scope.close)
+
+
+@contextmanager
+def _session_for_kb(knowledge_base_id: str) -> Iterator[Any]:
+    """Use the bound scope's session if there is one, else a fresh session."""
+    scope = _session_scope.get()
+    if scope is not None and not scope.closed:
+        yield scope.session(knowledge_base_id)
+        return
+
+    with get_graph_db().session_for_kb(knowledge_base_id) as session:
+        yield session
+
+
 def create_node(
     collection: Collection,
     node: NodeCreate,
@@ -40,7 +124,7 @@ def create_node(
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
+    with _session_for_kb(knowledge_base_id) as session:
         # Create node in graph database
         created_node = db.create_node(session, node, knowledge_base_id)
 
@@ -73,24 +157,125 @@ def create_node(
             if results["distances"]:
                 distances = results["distances"][0]
 
-                for i, target_id in enumerate(similar_ids):
-                    if target_id == created_node.id:
+                # Lower distance = more similar (L2 distance)
+                db.create_edges(
+                    session,
+                    [
+                        EdgeCreate(
+                            source_id=created_node.id,
+                            target_id=target_id,
+                            relation_type="SEMANTIC_RELATED",
+                            weight=int((2.0 - distances[i]) * 10),
+                        )
+                        for i, target_id in enumerate(similar_ids)
+                        if target_id != created_node.id and distances[i] < 1.5
+                    ],
+                )
+
+        logger.info(f"Created node {created_node.id} in KB {knowledge_base_id}")
+        return created_node
+
+
+def create_linked_nodes(
+    collection: Collection,
+    source_id: str,
+    links: list[tuple[NodeCreate, str, int]],
+    knowledge_base_id: str,
+) -> list[tuple[Node, str]]:
+    """
+    Create several nodes linked from one source node in a single pass.
+
+    Does what create_node plus create_edge would per node, but with one
+    graph write for the nodes, one for the edges and one ChromaDB add and
+    query for the whole batch.
+
+    Args:
+        collection: ChromaDB collection
+        source_id: ID of the node the new nodes are linked from
+        links: (node data, relation type, weight) per new node
+        knowledge_base_id: Knowledge base ID
+
+    Returns:
+        (created Node, relation type) pairs, in input order
+    """
+    if not links:
+        return []
+
+    db = get_graph_db()
+    nodes = [node for node, _, _ in links]
+
+    with _session_for_kb(knowledge_base_id) as session:
+        created_nodes = db.create_nodes(session, nodes, knowledge_base_id)
+        new_ids = [node.id for node in created_nodes]
+
+        embeddings = embedding_service.generate_embeddings([node.content for node in nodes])
+        collection.add(
+            ids=new_ids,
+            embeddings=embeddings,
+            metadatas=[
+                {
+                    "content": node.content,
+                    "type": node.node_type,
+                    "knowledge_base_id": knowledge_base_id,
+                }
+                for node in nodes
+            ],
+        )
+
+        edges = [
+            EdgeCreate(
+                source_id=source_id,
+                target_id=created.id,
+                relation_type=relation_type,
+                weight=weight,
+            )
+            for created, (_, relation_type, weight) in zip(created_nodes, links)
+        ]
+
+        # Semantic edges as create_node would add them one node at a time:
+        # each new node only sees its earlier siblings, so over-fetch by the
+        # batch size and drop later siblings before taking the top 4
+        kb_node_count = collection.count()
+        results = None
+        if kb_node_count > 1:
+            results = collection.query(
+                query_embeddings=embeddings,
+                n_results=min(3 + len(nodes), kb_node_count),
+                where={"knowledge_base_id": knowledge_base_id},
+                include=["distances"],
+            )
+
+        if results and results["distances"]:
+            position = {node_id: i for i, node_id in enumerate(new_ids)}
+            for i, node_id in enumerate(new_ids):
+                candidates = [
+                    (target_id, distance)
+                    for target_id, distance in zip(results["ids"][i], results["distances"][i])
+                    if position.get(target_id, -1) <= i
+                ][:4]
+
+                for target_id, distance in candidates:
+                    if target_id == node_id:
                         continue
 
                     # Lower distance = more similar (L2 distance)
-                    if distances[i] < 1.5:
-                        db.create_edge(
-                            session,
+                    if distance < 1.5:
+                        edges.append(
                             EdgeCreate(
-                                source_id=created_node.id,
+                                source_id=node_id,
                                 target_id=target_id,
                                 relation_type="SEMANTIC_RELATED",
-                                weight=int((2.0 - distances[i]) * 10),
-                            ),
+                                weight=int((2.0 - distance) * 10),
+                            )
                         )
 
-        logger.info(f"Created node {created_node.id} in KB {knowledge_base_id}")
-        return created_node
+        db.create_edges(session, edges)
+
+        logger.info(f"Created {len(created_nodes)} linked nodes in KB {knowledge_base_id}")
+        return [
+            (created, relation_type)
+            for created, (_, relation_type, _) in zip(created_nodes, links)
+        ]
 
 
 def get_node(
@@ -107,10 +292,39 @@ def get_node(
     Returns:
         Node if found, None otherwise
     """
+    cache_key = (knowledge_base_id, node_id)
+    cached = _node_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
-        return db.get_node(session, node_id)
+    with _session_for_kb(knowledge_base_id) as session:
+        node = db.get_node(session, node_id)
+
+    if node is not None:
+        _node_cache.set(cache_key, node)
+    return node
+
+
+def get_nodes(
+    node_ids: list[str],
+    knowledge_base_id: str,
+) -> list[Node]:
+    """
+    Get several nodes by ID in one backend round trip.
+
+    Args:
+        node_ids: Node IDs
+        knowledge_base_id: Knowledge base ID
+
+    Returns:
+        Nodes that were found (missing IDs are skipped)
+    """
+    db = get_graph_db()
+
+    with _session_for_kb(knowledge_base_id) as session:
+        return db.get_nodes(session, node_ids)
 
 
 def update_node(
@@ -131,8 +345,11 @@ def update_node(
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
-        return db.update_node(session, node_id, node)
+    with _session_for_kb(knowledge_base_id) as session:
+        updated = db.update_node(session, node_id, node)
+
+    _node_cache.pop((knowledge_base_id, node_id))
+    return updated
 
 
 def delete_node(
@@ -153,8 +370,9 @@ def delete_node(
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
+    with _session_for_kb(knowledge_base_id) as session:
         deleted = db.delete_node(session, node_id)
+        _node_cache.pop((knowledge_base_id, node_id))
 
         if deleted:
             # Also delete from ChromaDB
@@ -182,7 +400,7 @@ def create_edge(
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
+    with _session_for_kb(knowledge_base_id) as session:
         return db.create_edge(session, edge)
 
 
@@ -198,7 +416,7 @@ def get_graph_data(knowledge_base_id: str) -> GraphData:
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
+    with _session_for_kb(knowledge_base_id) as session:
         return db.get_graph_data(session)
 
 
@@ -218,13 +436,14 @@ def delete_all_nodes(
     """
     db = get_graph_db()
 
-    with db.session_for_kb(knowledge_base_id) as session:
+    with _session_for_kb(knowledge_base_id) as session:
         # Get all node IDs first for ChromaDB deletion
         graph_data = db.get_graph_data(session)
         node_ids = [node.id for node in graph_data.nodes]
 
         # Delete from graph database
         deleted_count = db.delete_all_nodes(session)
+        _node_cache.clear()
 
         # Delete from ChromaDB
         if node_ids:
@@ -248,4 +467,5 @@ def delete_kb_data(knowledge_base_id: str) -> bool:
         True if successful
     """
     db = get_graph_db()
+    _node_cache.clear()
     return db.delete_kb_data(knowledge_base_id)
@@ -5,9 +5,11 @@ This module handles startup tasks like creating the default superuser.
 """
 
 import secrets
+from contextlib import ExitStack
+from sqlalchemy import inspect, select, text
 from sqlalchemy.orm import Session
 
-from memexia_backend.models import User
+from memexia_backend.models import KnowledgeBase, User
 from memexia_backend.enums import UserRole
 from memexia_backend.config import settings
 from memexia_backend.utils.security import verify_password
@@ -88,6 +90,24 @@ def init_superuser(db: Session) -> None:
         logger.info("Superuser password was set from environment variable")
 
 
+def init_sql_schema() -> None:
+    """
+    Create SQL tables if any are missing.
+
+    A single table-name listing is cheaper than create_all's per-table
+    existence checks, so boots against an up-to-date schema skip DDL entirely.
+    """
+    from ..database import Base, engine
+
+    existing_tables = set(inspect(engine).get_table_names())
+    if set(Base.metadata.tables).issubset(existing_tables):
+        logger.debug("SQL schema up to date")
+        return
+
+    Base.metadata.create_all(bind=engine)
+    logger.info("SQL schema created")
+
+
 def init_database(db: Session) -> None:
     """
     Run all database initialization tasks.
@@ -126,31 +146,96 @@ def init_graph_db() -> None:
         raise
 
 
+def init_embedding_model() -> None:
+    """Load the embedding model during startup instead of on first use."""
+    from memexia_backend.services.embedding_service import embedding_service
+
+    logger.info(f"Loading embedding model: {settings.EMBEDDING_MODEL}")
+    embedding_service.preload()
+    logger.info("✅ Embedding model loaded")
+
+
+def warm_sql_pool() -> None:
+    """
+    Open the SQL pool's base connections before the first request arrives.
+
+    Each connection runs a trivial query (and, for SQLite, its PRAGMAs) so
+    early requests don't pay connection setup.
+    """
+    from ..database import engine
+
+    pool_size = getattr(engine.pool, "size", None)
+    count = pool_size() if callable(pool_size) else 1
+
+    with ExitStack() as stack:
+        for _ in range(count):
+            conn = stack.enter_context(engine.connect())
+            conn.execute(text("SELECT 1"))
+
+    logger.debug(f"Warmed {count} SQL connection(s)")
+
+
+def warm_graph_sessions(db: Session) -> None:
+    """
+    Open graph sessions for the most recently updated knowledge bases.
+
+    Kuzu keeps the opened databases and NebulaGraph keeps the space-bound
+    sessions idle, so the first requests against busy KBs skip setup.
+
+    Args:
+        db: SQLAlchemy database session
+    """
+    from memexia_backend.services.graph import get_graph_db
+
+    limit = settings.GRAPH_WARM_KB_COUNT
+    if limit <= 0:
+        return
+
+    kb_ids = db.scalars(
+        select(KnowledgeBase.id)
+        .order_by(KnowledgeBase.updated_at.desc())
+        .limit(limit)
+    ).all()
+
+    graph_db = get_graph_db()
+    for kb_id in kb_ids:
+        try:
+            with graph_db.session_for_kb(kb_id):
+                pass
+        except Exception as e:
+            logger.warning(f"Could not warm graph session for KB {kb_id}: {e}")
+
+    logger.debug(f"Warmed graph sessions for {len(kb_ids)} knowledge base(s)")
+
+
 def init_all_services() -> None:
     """
     Initialize all required services.
 
     This function is called during FastAPI startup and handles:
     - Graph database initialization (Kuzu embedded or NebulaGraph remote)
+    - Embedding model loading
     - Database schema initialization
     - Superuser creation
+    - Warming SQL and graph connections
     """
     import sys
 
     logger.info("🚀 Initializing all services...")
 
     try:
-        from ..database import SessionLocal
+        from ..database import session_scope
 
-        # Initialize graph database
+        # Initialize graph database and embedding model
         init_graph_db()
+        init_embedding_model()
 
-        # Initialize SQL database and superuser
-        db = SessionLocal()
-        try:
+        # Initialize SQL schema, then superuser
+        init_sql_schema()
+        warm_sql_pool()
+        with session_scope() as db:
             init_database(db)
-        finally:
-            db.close()
+            warm_graph_sessions(db)
 
         logger.info("✅ All services initialized successfully")
 
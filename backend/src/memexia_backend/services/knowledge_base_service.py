@@ -5,9 +5,10 @@ This service handles all knowledge base related operations including
 creation, retrieval, update, deletion, and copying.
 """
 
+import uuid
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import false, func, or_, true
 
 from memexia_backend.models import KnowledgeBase, User
 from memexia_backend.schemas import (
@@ -74,7 +75,12 @@ class KnowledgeBaseService:
         Returns:
             KnowledgeBase if found and accessible, None otherwise
         """
-        kb = db.query(KnowledgeBase).filter(KnowledgeBase.id == kb_id).first()
+        try:
+            kb_uuid = uuid.UUID(kb_id)
+        except ValueError:
+            return None
+
+        kb = db.query(KnowledgeBase).filter(KnowledgeBase.id == str(kb_uuid)).first()
 
         if not kb:
             return None
@@ -85,6 +91,47 @@ class KnowledgeBaseService:
 
         return kb
 
+    def get_by_id_for_write(
+        self,
+        db: Session,
+        kb_id: str,
+        user: User,
+        permission: Permission,
+    ) -> tuple[Optional[KnowledgeBase], bool]:
+        """
+        Get a knowledge base and whether the user may act on it, in one query.
+
+        Args:
+            db: Database session
+            kb_id: Knowledge base ID
+            user: Current user
+            permission: Permission that covers knowledge bases the user does
+                not own (e.g. KB_UPDATE_ALL)
+
+        Returns:
+            Tuple of (KnowledgeBase if found and accessible, whether the
+            user is allowed to act on it)
+        """
+        try:
+            kb_uuid = uuid.UUID(kb_id)
+        except ValueError:
+            return None, False
+
+        can_act = or_(
+            KnowledgeBase.owner_id == user.id,
+            true() if check_permission(user, permission) else false(),
+        )
+        row = (
+            db.query(KnowledgeBase, can_act.label("can_act"))
+            .filter(KnowledgeBase.id == str(kb_uuid), self._access_clause(user))
+            .first()
+        )
+
+        if row is None:
+            return None, False
+
+        return row[0], bool(row.can_act)
+
     def get_list(
         self,
         db: Session,
@@ -108,37 +155,28 @@ class KnowledgeBaseService:
         """
         query = db.query(KnowledgeBase)
 
-        if user is None:
-            # Guest: only public knowledge bases
-            query = query.filter(KnowledgeBase.is_public)
-        elif owner_only:
+        if user is not None and owner_only:
             # Only user's own knowledge bases
             query = query.filter(KnowledgeBase.owner_id == user.id)
-        elif check_permission(user, Permission.KB_READ_ALL):
-            # Admin: all knowledge bases
-            pass
         else:
-            # Regular user: own + public
-            query = query.filter(
-                or_(
-                    KnowledgeBase.owner_id == user.id,
-                    KnowledgeBase.is_public,
-                )
-            )
-
-        # Get total count
-        total = query.count()
-
-        # Apply pagination
+            query = query.filter(self._access_clause(user))
+
+        # Fetch the page and the total count in one query via a window count
         offset = (page - 1) * page_size
-        items = (
-            query.order_by(KnowledgeBase.created_at.desc())
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .order_by(KnowledgeBase.created_at.desc())
             .offset(offset)
             .limit(page_size)
             .all()
         )
 
-        return items, total
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+
+        # Past the last page the window yields no rows; count separately
+        total = query.count() if page > 1 else 0
+        return [], total
 
     def update(
         self,
@@ -228,6 +266,32 @@ class KnowledgeBaseService:
 
         return new_kb
 
+    def _access_clause(self, user: Optional[User]):
+        """
+        Build the SQL predicate matching knowledge bases a user can access.
+
+        Mirrors _can_access for use in query filters.
+
+        Args:
+            user: Current user (None for guest)
+
+        Returns:
+            SQLAlchemy boolean clause
+        """
+        # Guests only see public knowledge bases
+        if user is None:
+            return KnowledgeBase.is_public.is_(True)
+
+        # Admins can access all knowledge bases
+        if check_permission(user, Permission.KB_READ_ALL):
+            return true()
+
+        # Regular user: own + public
+        return or_(
+            KnowledgeBase.owner_id == user.id,
+            KnowledgeBase.is_public.is_(True),
+        )
+
     def _can_access(self, kb: KnowledgeBase, user: Optional[User]) -> bool:
         """
         Check if a user can access a knowledge base.
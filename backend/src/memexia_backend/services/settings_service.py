@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from memexia_backend.models import SystemSetting
 from memexia_backend.schemas import AuthSettings, GraphDBSettings
 from memexia_backend.config import settings as env_settings
+from memexia_backend.utils.cache import TTLCache
 
 from typing import Any
 
@@ -11,18 +12,40 @@ class SettingsService:
     AUTH_SETTINGS_KEY = "auth_settings"
     GRAPH_DB_SETTINGS_KEY = "graph_db_settings"
 
-    @staticmethod
-    def get_setting(db: Session, key: str, default: Any = None) -> Any:
+    # Settings rows change rarely; keep parsed values for a short while so
+    # hot paths (login, register) don't query them on every request.
+    # Writes through set_setting invalidate immediately in this process.
+    _cache = TTLCache(maxsize=64, ttl=60)
+    _MISSING = object()
+
+    @classmethod
+    def invalidate_cache(cls, key: str | None = None) -> None:
+        """Drop cached settings (one key, or all)."""
+        if key is None:
+            cls._cache.clear()
+        else:
+            cls._cache.pop(key)
+
+    @classmethod
+    def get_setting(cls, db: Session, key: str, default: Any = None) -> Any:
+        cached = cls._cache.get(key, cls._MISSING)
+        if cached is not cls._MISSING:
+            return cached
+
         setting = db.query(SystemSetting).filter(SystemSetting.key == key).first()
-        if setting:
-            try:
-                return json.loads(setting.value)
-            except json.JSONDecodeError:
-                return setting.value
-        return default
-
-    @staticmethod
-    def set_setting(db: Session, key: str, value: Any, description: str | None = None):
+        if not setting:
+            return default
+
+        try:
+            value = json.loads(setting.value)
+        except json.JSONDecodeError:
+            value = setting.value
+
+        cls._cache.set(key, value)
+        return value
+
+    @classmethod
+    def set_setting(cls, db: Session, key: str, value: Any, description: str | None = None):
         setting = db.query(SystemSetting).filter(SystemSetting.key == key).first()
         json_value = json.dumps(value)
 
@@ -36,6 +59,7 @@ class SettingsService:
 
         db.commit()
         db.refresh(setting)
+        cls.invalidate_cache(key)
         return setting
 
     @classmethod
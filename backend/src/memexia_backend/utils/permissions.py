@@ -22,11 +22,18 @@ Usage:
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Callable, Any
 
 from fastapi import Depends, HTTPException, status
 
-from memexia_backend.enums import Permission, UserRole, ROLE_PERMISSIONS
+from memexia_backend.enums import (
+    Permission,
+    UserRole,
+    ROLE_PERMISSIONS,
+    role_has_permission,
+)
+from memexia_backend.utils.cache import TTLCache
 
 
 class PermissionChecker(ABC):
@@ -43,7 +50,7 @@ class PermissionChecker(ABC):
         pass
 
     @abstractmethod
-    def get_user_permissions(self, user: Any) -> set[Permission]:
+    def get_user_permissions(self, user: Any) -> frozenset[Permission]:
         """Get all permissions for a user."""
         pass
 
@@ -66,24 +73,24 @@ class StaticPermissionChecker(PermissionChecker):
 
         try:
             role = UserRole(user_role)
-            return permission in ROLE_PERMISSIONS.get(role, set())
+            return role_has_permission(role, permission)
         except ValueError:
             return False
 
-    def get_user_permissions(self, user: Any) -> set[Permission]:
+    def get_user_permissions(self, user: Any) -> frozenset[Permission]:
         """Get all permissions based on user's role."""
         if user is None:
-            return set()
+            return frozenset()
 
         user_role = getattr(user, "role", None)
         if user_role is None:
-            return set()
+            return frozenset()
 
         try:
             role = UserRole(user_role)
-            return ROLE_PERMISSIONS.get(role, set())
+            return ROLE_PERMISSIONS.get(role, frozenset())
         except ValueError:
-            return set()
+            return frozenset()
 
 
 # Global permission checker instance
@@ -122,9 +129,43 @@ def check_all_permissions(user: Any, permissions: list[Permission]) -> bool:
     return all(_permission_checker.has_permission(user, p) for p in permissions)
 
 
+# Short-lived record of usernames confirmed as admins, so polling admin
+# endpoints can skip the user lookup. Role and account changes must call
+# invalidate_admin_cache so revocations apply immediately.
+_admin_cache = TTLCache(maxsize=1024, ttl=30)
+
+
+def is_cached_admin(username: str) -> bool:
+    """Check whether a username was recently confirmed as an admin."""
+    return _admin_cache.get(username, False)
+
+
+def cache_admin(username: str) -> None:
+    """Remember that a username is an admin for the next few seconds."""
+    _admin_cache.set(username, True)
+
+
+def invalidate_admin_cache(username: Optional[str] = None) -> None:
+    """
+    Forget cached admin status.
+
+    Args:
+        username: User to forget, or None to clear the whole cache
+    """
+    if username is None:
+        _admin_cache.clear()
+    else:
+        _admin_cache.pop(username)
+
+
 # FastAPI dependency factories
+#
+# Factories are cached so every route asking for the same check gets the same
+# dependency callable; FastAPI keys its per-request dependency cache on that
+# identity, so repeated checks in one request resolve once.
 
 
+@lru_cache(maxsize=None)
 def require_permission(permission: Permission) -> Callable:
     """
     Create a FastAPI dependency that requires a specific permission.
@@ -151,10 +192,15 @@ def require_any_permission(permissions: list[Permission]) -> Callable:
     """
     Create a FastAPI dependency that requires any of the specified permissions.
     """
+    return _require_any_permission(tuple(permissions))
+
+
+@lru_cache(maxsize=None)
+def _require_any_permission(permissions: tuple[Permission, ...]) -> Callable:
     from memexia_backend.routers.v1.auth import get_current_user
 
     def dependency(current_user=Depends(get_current_user)):
-        if not check_any_permission(current_user, permissions):
+        if not check_any_permission(current_user, list(permissions)):
             permission_names = [p.value for p in permissions]
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -165,6 +211,7 @@ def require_any_permission(permissions: list[Permission]) -> Callable:
     return dependency
 
 
+@lru_cache(maxsize=None)
 def require_role(role: UserRole) -> Callable:
     """
     Create a FastAPI dependency that requires a specific role.
@@ -196,8 +243,8 @@ def get_current_user_optional() -> Callable:
     """
     from memexia_backend.routers.v1.auth import oauth2_scheme, get_user
     from memexia_backend.database import get_db
-    from memexia_backend.config import settings
-    from jose import JWTError, jwt
+    from memexia_backend.utils.security import decode_token
+    from jose import JWTError
     from sqlalchemy.orm import Session
 
     def dependency(
@@ -207,9 +254,7 @@ def get_current_user_optional() -> Callable:
         if token is None:
             return None
         try:
-            payload = jwt.decode(
-                token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-            )
+            payload = decode_token(token)
             username: str | None = payload.get("sub")
             if username is None:
                 return None
@@ -1,12 +1,16 @@
-from datetime import datetime, timedelta
-from typing import Optional, TYPE_CHECKING
+import hashlib
+import time
+from datetime import timedelta
+from typing import Any, Optional, TYPE_CHECKING
 from jose import jwt, JWTError
 from jose.exceptions import ExpiredSignatureError
 from fastapi import HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 import bcrypt
 
 from ..config import settings
+from .cache import TTLCache
 
 if TYPE_CHECKING:
     from ..models import User
@@ -19,9 +23,9 @@ def get_password_hash(password):
     - Prevents password equivalence attacks
     - Safe for arbitrarily long passwords
     """
-    password_digest=hashlib.sha256(password.encode("utf-8")).digest()
-    salt=bcrypt.gensalt()
-    hashed=bcrypt.hashpw(password_digest, salt)
+    password_digest = hashlib.sha256(password.encode("utf-8")).digest()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(password_digest, salt)
     return hashed.decode("utf-8")
 
 def verify_password(plain_password, hashed_password):
@@ -36,16 +40,45 @@ def verify_password(plain_password, hashed_password):
         return False
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+    lifetime = expires_delta or timedelta(minutes=15)
+    # Integer epoch seconds are what the JWT "exp" claim holds anyway
+    to_encode.update({"exp": int(time.time() + lifetime.total_seconds())})
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
     )
     return encoded_jwt
 
+# Decoded JWT payloads keyed by raw token, so repeated requests with the same
+# token skip signature verification. Entries never outlive the token's `exp`.
+_token_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def decode_token(token: str) -> dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing recent results for the same token.
+
+    Raises:
+        ExpiredSignatureError: If the token has expired
+        JWTError: If the token is otherwise invalid
+    """
+    payload = _token_cache.get(token)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(
+        token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
+    )
+
+    ttl = _token_cache.ttl
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        _token_cache.set(token, payload, ttl=ttl)
+
+    return payload
+
+
 def verify_token_and_get_user(token: str, token_type: str, db: Session) -> "User":
     """
     Verify JWT token and retrieve the associated user.
@@ -69,9 +102,7 @@ def verify_token_and_get_user(token: str, token_type: str, db: Session) -> "User
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = decode_token(token)
         username: Optional[str] = payload.get("sub")
         type_in_token: Optional[str] = payload.get("type")
 
@@ -81,7 +112,9 @@ def verify_token_and_get_user(token: str, token_type: str, db: Session) -> "User
     except (JWTError, ExpiredSignatureError):
         raise credentials_exception
 
-    user = db.query(User).filter(User.username == username).first()
+    user = db.execute(
+        select(User).where(User.username == username)
+    ).scalar_one_or_none()
     if user is None:
         raise credentials_exception
     return user
@@ -0,0 +1,48 @@
+import os
+
+# Settings are read at import time and SUPERUSER_PASSWORD has no default
+os.environ.setdefault("SUPERUSER_PASSWORD", "test-password")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from memexia_backend.database import Base
+from memexia_backend.models import User
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database with all tables."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def make_user(db):
+    """Create and persist a user with the given username and role."""
+
+    def make(username: str, role: str = "user", **fields) -> User:
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            hashed_password="not-a-real-hash",
+            role=role,
+            **fields,
+        )
+        db.add(user)
+        db.commit()
+        return user
+
+    return make
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from memexia_backend.config import settings
+from memexia_backend.services import graph_service
+from memexia_backend.services.ai_service import AIService
+
+KB_ID = "test-kb"
+
+# First concept closes early, then the model keeps writing
+FIRST_CONCEPT = '{"concepts": [{"content": "first", "relation": "leads to"}'
+
+
+def _chunk(content: str):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+class FakeStream:
+    def __init__(self, deltas: list[str], error: Exception | None = None):
+        self._deltas = deltas
+        self._error = error
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for delta in self._deltas:
+            await asyncio.sleep(0)
+            yield _chunk(delta)
+        if self._error is not None:
+            raise self._error
+
+
+def _fake_client(stream: FakeStream):
+    async def create(**kwargs):
+        return stream
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record slow bulk writes and which ones ran to completion."""
+    record = {"started": 0, "finished": 0}
+
+    def create_linked_nodes(collection, source_id, links, knowledge_base_id):
+        record["started"] += 1
+        time.sleep(0.2)
+        record["finished"] += 1
+        return []
+
+    source = SimpleNamespace(id="source", content="source concept")
+    monkeypatch.setattr(graph_service, "get_node", lambda node_id, kb_id: source)
+    monkeypatch.setattr(graph_service, "create_linked_nodes", create_linked_nodes)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "AI_CACHE_TTL_SECONDS", 0)
+    return record
+
+
+def _service(stream: FakeStream) -> AIService:
+    service = AIService()
+    service._client = _fake_client(stream)
+    return service
+
+
+def _other_tasks() -> list[asyncio.Task]:
+    return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+def test_closing_stream_mid_write_waits_for_background_write(writes):
+    stream = FakeStream([FIRST_CONCEPT] + [" "] * 100 + ["]}"])
+
+    async def run():
+        events = _service(stream).expand_node_stream(None, "source", KB_ID)
+        async for event in events:
+            if b'"parsing"' in event:
+                break
+        # Resume once more so the background write gets started
+        await events.__anext__()
+        await asyncio.sleep(0.05)
+        assert writes["started"] == 1
+
+        # Client disconnects while the write is in flight
+        await events.aclose()
+
+        assert writes["finished"] == 1
+        assert _other_tasks() == []
+
+    asyncio.run(run())
+
+
+def test_stream_error_mid_read_leaves_no_task_behind(writes):
+    stream = FakeStream([FIRST_CONCEPT, " ", " "], error=RuntimeError("connection reset"))
+
+    async def run():
+        events = [
+            event
+            async for event in _service(stream).expand_node_stream(None, "source", KB_ID)
+        ]
+
+        assert b'"error"' in events[-1]
+        assert b"connection reset" in events[-1]
+        assert writes["finished"] == writes["started"]
+        assert _other_tasks() == []
+
+    asyncio.run(run())
@@ -0,0 +1,110 @@
+import pytest
+
+from memexia_backend.enums import Permission
+from memexia_backend.schemas import KnowledgeBaseCreate
+from memexia_backend.services.knowledge_base_service import knowledge_base_service
+
+
+@pytest.fixture
+def users(make_user):
+    return {
+        "owner": make_user("owner"),
+        "other": make_user("other"),
+        "admin": make_user("admin", role="admin"),
+    }
+
+
+@pytest.fixture
+def kbs(db, users):
+    owner = users["owner"]
+    return {
+        "public": knowledge_base_service.create(
+            db, KnowledgeBaseCreate(name="Public", is_public=True), owner
+        ),
+        "private": knowledge_base_service.create(
+            db, KnowledgeBaseCreate(name="Private"), owner
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "username, kb_name, visible",
+    [
+        (None, "public", True),
+        (None, "private", False),
+        ("owner", "private", True),
+        ("other", "public", True),
+        ("other", "private", False),
+        ("admin", "private", True),
+    ],
+)
+def test_get_by_id_access(db, users, kbs, username, kb_name, visible):
+    user = users[username] if username else None
+
+    kb = knowledge_base_service.get_by_id(db, kbs[kb_name].id, user)
+
+    assert (kb is not None) == visible
+
+
+def test_get_by_id_ignores_malformed_id(db, kbs):
+    assert knowledge_base_service.get_by_id(db, "not-a-uuid") is None
+
+
+def test_get_by_id_accepts_non_canonical_uuid(db, kbs):
+    kb_id = kbs["public"].id
+
+    assert knowledge_base_service.get_by_id(db, kb_id.upper()).id == kb_id
+
+
+@pytest.mark.parametrize(
+    "username, kb_name, found, can_act",
+    [
+        ("owner", "private", True, True),
+        ("other", "public", True, False),
+        ("other", "private", False, False),
+        ("admin", "private", True, True),
+    ],
+)
+def test_get_by_id_for_write(db, users, kbs, username, kb_name, found, can_act):
+    kb, allowed = knowledge_base_service.get_by_id_for_write(
+        db, kbs[kb_name].id, users[username], Permission.KB_UPDATE_ALL
+    )
+
+    assert (kb is not None) == found
+    assert allowed == can_act
+
+
+@pytest.mark.parametrize(
+    "username, expected",
+    [
+        (None, {"Public"}),
+        ("other", {"Public"}),
+        ("owner", {"Public", "Private"}),
+        ("admin", {"Public", "Private"}),
+    ],
+)
+def test_get_list_applies_access_clause(db, users, kbs, username, expected):
+    user = users[username] if username else None
+
+    items, total = knowledge_base_service.get_list(db, user)
+
+    assert {kb.name for kb in items} == expected
+    assert total == len(expected)
+
+
+def test_get_list_owner_only(db, users, kbs):
+    knowledge_base_service.create(
+        db, KnowledgeBaseCreate(name="Elsewhere", is_public=True), users["other"]
+    )
+
+    items, total = knowledge_base_service.get_list(db, users["owner"], owner_only=True)
+
+    assert {kb.name for kb in items} == {"Public", "Private"}
+    assert total == 2
+
+
+def test_get_list_reports_total_past_last_page(db, users, kbs):
+    items, total = knowledge_base_service.get_list(db, users["owner"], page=5, page_size=1)
+
+    assert items == []
+    assert total == 2
@@ -0,0 +1,116 @@
+import pytest
+
+from memexia_backend.schemas import EdgeCreate, NodeCreate, NodeUpdate
+from memexia_backend.services.graph.kuzu_backend import KuzuGraphDatabase
+
+KB_ID = "test-kb"
+
+
+@pytest.fixture
+def backend(tmp_path):
+    db = KuzuGraphDatabase(base_path=str(tmp_path))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def session(backend):
+    with backend.session_for_kb(KB_ID) as conn:
+        yield conn
+
+
+def _nodes(count: int) -> list[NodeCreate]:
+    return [NodeCreate(content=f"concept {i}", node_type="concept") for i in range(count)]
+
+
+def test_create_nodes_writes_all_rows(backend, session):
+    created = backend.create_nodes(session, _nodes(3), KB_ID)
+
+    assert [node.content for node in created] == ["concept 0", "concept 1", "concept 2"]
+    assert len({node.id for node in created}) == 3
+    assert {node.created_at for node in created} == {created[0].created_at}
+
+    stored = backend.get_nodes(session, [node.id for node in created])
+    assert {node.id for node in stored} == {node.id for node in created}
+
+
+def test_create_nodes_with_no_rows(backend, session):
+    assert backend.create_nodes(session, [], KB_ID) == []
+
+
+def test_create_edges_skips_missing_endpoints(backend, session):
+    a, b, c = backend.create_nodes(session, _nodes(3), KB_ID)
+
+    created = backend.create_edges(session, [
+        EdgeCreate(source_id=a.id, target_id=b.id, relation_type="leads to", weight=4),
+        EdgeCreate(source_id=a.id, target_id=c.id, relation_type="is a"),
+        EdgeCreate(source_id=a.id, target_id="missing", relation_type="is a", weight=1),
+    ])
+
+    assert [(edge.target_id, edge.relation_type, edge.weight) for edge in created] == [
+        (b.id, "leads to", 4),
+        (c.id, "is a", 1),
+    ]
+    assert created[0].id == f"{a.id}->{b.id}"
+
+    graph = backend.get_graph_data(session)
+    assert len(graph.nodes) == 3
+    assert {(edge.source_id, edge.target_id) for edge in graph.edges} == {
+        (a.id, b.id),
+        (a.id, c.id),
+    }
+
+
+def test_create_edge_returns_none_for_missing_endpoint(backend, session):
+    (a,) = backend.create_nodes(session, _nodes(1), KB_ID)
+
+    assert backend.create_edge(session, EdgeCreate(source_id=a.id, target_id="missing")) is None
+
+
+def test_update_node_returns_updated_row(backend, session):
+    node = backend.create_node(session, NodeCreate(content="old", node_type="concept"), KB_ID)
+
+    updated = backend.update_node(session, node.id, NodeUpdate(content="new"))
+
+    assert updated.content == "new"
+    assert updated.node_type == "concept"
+    assert backend.get_node(session, node.id).content == "new"
+    assert backend.update_node(session, "missing", NodeUpdate(content="x")) is None
+
+
+def test_delete_node_removes_node_and_edges(backend, session):
+    a, b = backend.create_nodes(session, _nodes(2), KB_ID)
+    backend.create_edges(session, [EdgeCreate(source_id=a.id, target_id=b.id)])
+
+    assert backend.delete_node(session, a.id) is True
+    assert backend.delete_node(session, a.id) is False
+
+    graph = backend.get_graph_data(session)
+    assert [node.id for node in graph.nodes] == [b.id]
+    assert graph.edges == []
+
+
+def test_delete_all_nodes_reports_count(backend, session):
+    backend.create_nodes(session, _nodes(4), KB_ID)
+
+    assert backend.delete_all_nodes(session) == 4
+    assert backend.get_graph_data(session).nodes == []
+
+
+def test_named_queries_run_repeatedly(backend, session):
+    backend.create_nodes(session, _nodes(1), KB_ID)
+    backend.create_nodes(session, _nodes(1), KB_ID)
+
+    assert len(backend.get_graph_data(session).nodes) == 2
+
+
+def test_delete_kb_data_drops_database(backend, tmp_path):
+    with backend.session_for_kb(KB_ID) as conn:
+        backend.create_nodes(conn, _nodes(1), KB_ID)
+
+    assert backend.delete_kb_data(KB_ID) is True
+    assert list(tmp_path.iterdir()) == []
+
+    # A fresh, empty database is created on next use
+    with backend.session_for_kb(KB_ID) as conn:
+        assert backend.get_graph_data(conn).nodes == []
@@ -0,0 +1,124 @@
+import pytest
+
+pytest.importorskip("nebula3")
+
+from memexia_backend.schemas import EdgeCreate, NodeCreate
+from memexia_backend.services.graph import nebula_backend
+from memexia_backend.services.graph.nebula_backend import NebulaGraphDatabase
+
+KB_ID = "test-kb"
+
+
+class FakeResult:
+    def __init__(self, succeeded: bool = True):
+        self._succeeded = succeeded
+
+    def is_succeeded(self) -> bool:
+        return self._succeeded
+
+    def error_msg(self) -> str:
+        return "" if self._succeeded else "write failed"
+
+
+class FakeSession:
+    """Records statements; fails the statement numbered in fail_on."""
+
+    def __init__(self, fail_on: int = -1):
+        self.calls: list[tuple[str, dict]] = []
+        self._fail_on = fail_on
+
+    def execute_parameter(self, stmt: str, params):
+        self.calls.append((stmt, params or {}))
+        return FakeResult(len(self.calls) - 1 != self._fail_on)
+
+    def execute(self, stmt: str):
+        return self.execute_parameter(stmt, None)
+
+
+def _param(params: dict, name: str):
+    value = params[name]
+    return value.get_sVal().decode() if value.getType() == value.SVAL else value.get_iVal()
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(nebula_backend, "_INSERT_BATCH_SIZE", 2)
+    db = NebulaGraphDatabase()
+    # Every referenced endpoint exists
+    monkeypatch.setattr(db, "_existing_node_ids", lambda session, ids: set(ids))
+    return db
+
+
+def test_create_nodes_batches_and_binds_values(backend):
+    session = FakeSession()
+    nodes = [NodeCreate(content=f'say "hi" {i}', node_type="concept") for i in range(5)]
+
+    created = backend.create_nodes(session, nodes, KB_ID)
+
+    assert [node.content for node in created] == [node.content for node in nodes]
+    assert len(session.calls) == 3
+
+    stmt, params = session.calls[0]
+    assert "INSERT VERTEX Node" in stmt
+    assert f'"{created[0].id}":($c0, $t0, $now, $now)' in stmt
+    assert f'"{created[1].id}":($c1, $t1, $now, $now)' in stmt
+    # User content only travels as bound parameters
+    assert "say" not in stmt
+    assert _param(params, "c1") == 'say "hi" 1'
+    assert _param(params, "t0") == "concept"
+    assert _param(params, "now") == created[0].created_at.isoformat()
+
+    _, last_params = session.calls[2]
+    assert _param(last_params, "c0") == 'say "hi" 4'
+    assert "c1" not in last_params
+
+
+def test_create_nodes_raises_on_failed_batch(backend):
+    session = FakeSession(fail_on=1)
+    nodes = [NodeCreate(content=f"concept {i}") for i in range(4)]
+
+    with pytest.raises(RuntimeError, match="Failed to create nodes"):
+        backend.create_nodes(session, nodes, KB_ID)
+
+
+def test_create_edges_batches_and_binds_values(backend):
+    session = FakeSession()
+    edges = [
+        EdgeCreate(source_id="a", target_id=f"n{i}", relation_type=f"causes {i}", weight=i)
+        for i in range(3)
+    ]
+
+    created = backend.create_edges(session, edges)
+
+    assert [(edge.target_id, edge.weight) for edge in created] == [
+        ("n0", 0), ("n1", 1), ("n2", 2),
+    ]
+    assert len(session.calls) == 2
+
+    stmt, params = session.calls[0]
+    assert '"a"->"n0":($r0, $w0)' in stmt
+    assert '"a"->"n1":($r1, $w1)' in stmt
+    assert "causes" not in stmt
+    assert _param(params, "r1") == "causes 1"
+    assert _param(params, "w1") == 1
+
+
+def test_create_edges_skips_missing_endpoints(backend, monkeypatch):
+    monkeypatch.setattr(backend, "_existing_node_ids", lambda session, ids: {"a", "b"})
+    session = FakeSession()
+
+    created = backend.create_edges(session, [
+        EdgeCreate(source_id="a", target_id="b"),
+        EdgeCreate(source_id="a", target_id="missing"),
+    ])
+
+    assert [(edge.source_id, edge.target_id) for edge in created] == [("a", "b")]
+    assert len(session.calls) == 1
+
+
+def test_create_edges_raises_on_failed_batch(backend):
+    session = FakeSession(fail_on=1)
+    edges = [EdgeCreate(source_id="a", target_id=f"n{i}") for i in range(4)]
+
+    with pytest.raises(RuntimeError, match="Failed to create edges"):
+        backend.create_edges(session, edges)
@@ -0,0 +1,91 @@
+import pytest
+from fastapi import HTTPException
+
+from memexia_backend.routers.v1.admin import check_admin
+from memexia_backend.utils import cache as cache_module
+from memexia_backend.utils import permissions
+from memexia_backend.utils.permissions import (
+    cache_admin,
+    invalidate_admin_cache,
+    is_cached_admin,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_admin_cache():
+    invalidate_admin_cache()
+    yield
+    invalidate_admin_cache()
+
+
+def test_admin_cache_remembers_and_forgets():
+    assert not is_cached_admin("alice")
+
+    cache_admin("alice")
+    assert is_cached_admin("alice")
+
+    invalidate_admin_cache("alice")
+    assert not is_cached_admin("alice")
+
+
+def test_invalidate_admin_cache_without_username_clears_all():
+    cache_admin("alice")
+    cache_admin("bob")
+
+    invalidate_admin_cache()
+
+    assert not is_cached_admin("alice")
+    assert not is_cached_admin("bob")
+
+
+def test_admin_cache_entries_expire(monkeypatch):
+    cache_admin("alice")
+
+    real_monotonic = cache_module.time.monotonic
+    monkeypatch.setattr(
+        cache_module.time,
+        "monotonic",
+        lambda: real_monotonic() + permissions._admin_cache.ttl + 1,
+    )
+
+    assert not is_cached_admin("alice")
+
+
+def test_check_admin_caches_confirmed_admin(db, make_user):
+    make_user("root", role="admin")
+
+    assert check_admin(username="root", db=db) == "root"
+    assert is_cached_admin("root")
+
+    # A cached admin is accepted without touching the database
+    assert check_admin(username="root", db=None) == "root"
+
+
+def test_check_admin_rejects_non_admin(db, make_user):
+    make_user("alice")
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_admin(username="alice", db=db)
+
+    assert exc_info.value.status_code == 403
+    assert not is_cached_admin("alice")
+
+
+def test_check_admin_rejects_unknown_user(db):
+    with pytest.raises(HTTPException) as exc_info:
+        check_admin(username="ghost", db=db)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_revoked_admin_is_rechecked(db, make_user):
+    user = make_user("root", role="admin")
+    check_admin(username="root", db=db)
+
+    user.role = "user"
+    db.commit()
+    invalidate_admin_cache("root")
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_admin(username="root", db=db)
+    assert exc_info.value.status_code == 403
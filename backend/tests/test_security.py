@@ -0,0 +1,81 @@
+import time
+from datetime import timedelta
+
+import pytest
+from jose import JWTError
+from jose.exceptions import ExpiredSignatureError
+
+from memexia_backend.utils import cache, security
+from memexia_backend.utils.security import create_access_token, decode_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    security._token_cache.clear()
+    yield
+    security._token_cache.clear()
+
+
+def test_decode_token_returns_payload():
+    token = create_access_token({"sub": "alice"})
+
+    assert decode_token(token)["sub"] == "alice"
+
+
+def test_decode_token_reuses_cached_payload(monkeypatch):
+    token = create_access_token({"sub": "alice"})
+    first = decode_token(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cached token was verified again")
+
+    monkeypatch.setattr(security.jwt, "decode", fail)
+
+    assert decode_token(token) is first
+
+
+def test_decode_token_rejects_invalid_token():
+    with pytest.raises(JWTError):
+        decode_token("not-a-jwt")
+
+    assert security._token_cache.get("not-a-jwt") is None
+
+
+def test_decode_token_rejects_expired_token():
+    token = create_access_token({"sub": "alice"}, timedelta(seconds=-1))
+
+    with pytest.raises(ExpiredSignatureError):
+        decode_token(token)
+
+
+def test_cached_payload_does_not_outlive_token_expiry(monkeypatch):
+    token = create_access_token({"sub": "alice"}, timedelta(seconds=30))
+    decode_token(token)
+
+    # Past the token's exp, though still inside the cache TTL, the cached
+    # payload must not be served; verification reports the expiry instead
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(cache.time, "monotonic", lambda: real_monotonic() + 45)
+    verified = []
+
+    def expired(*args, **kwargs):
+        verified.append(args[0])
+        raise ExpiredSignatureError("Signature has expired.")
+
+    monkeypatch.setattr(security.jwt, "decode", expired)
+
+    with pytest.raises(ExpiredSignatureError):
+        decode_token(token)
+    assert verified == [token]
+    assert security._token_cache.get(token) is None
+
+
+def test_token_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(security._token_cache, "maxsize", 2)
+    tokens = [create_access_token({"sub": f"user{i}"}) for i in range(3)]
+
+    for token in tokens:
+        decode_token(token)
+
+    assert security._token_cache.get(tokens[0]) is None
+    assert all(security._token_cache.get(token) for token in tokens[1:])